@@ -8,7 +8,7 @@ const ALLOWED_ORIGIN_PATTERNS = [
   /^asset:\/\/localhost$/,
 ];
 
-function isAllowedOrigin(origin) {
+export function isAllowedOrigin(origin) {
   return Boolean(origin) && ALLOWED_ORIGIN_PATTERNS.some((pattern) => pattern.test(origin));
 }
 
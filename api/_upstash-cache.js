@@ -34,19 +34,31 @@ async function ensureDesktopCache() {
   }, 60_000).unref?.();
 }
 
+// Serialized form of each entry, reused across persists. Writes replace the
+// entry object rather than mutating it, so keying on the entry invalidates
+// itself and an unchanged entry is encoded once instead of on every flush.
+const serializedEntries = new WeakMap();
+
+function serializeEntry(entry) {
+  let json = serializedEntries.get(entry);
+  if (json === undefined) {
+    json = JSON.stringify(entry);
+    serializedEntries.set(entry, json);
+  }
+  return json;
+}
+
 function buildPersistSnapshot() {
   const now = Date.now();
-  const payload = Object.create(null);
-  let kept = 0;
+  const parts = [];
 
   for (const [key, entry] of mem) {
     if (!entry || entry.expiresAt <= now) continue;
-    payload[key] = entry;
-    kept += 1;
-    if (kept >= MAX_PERSIST_ENTRIES) break;
+    parts.push(`${JSON.stringify(key)}:${serializeEntry(entry)}`);
+    if (parts.length >= MAX_PERSIST_ENTRIES) break;
   }
 
-  return payload;
+  return `{${parts.join(',')}}`;
 }
 
 async function persistToDisk() {
@@ -58,8 +70,7 @@ async function persistToDisk() {
 
   persistInFlight = true;
   try {
-    const snapshot = buildPersistSnapshot();
-    const json = JSON.stringify(snapshot);
+    const json = buildPersistSnapshot();
     const { writeFile, rename } = await import('node:fs/promises');
     const tmp = persistPath + '.tmp';
     await writeFile(tmp, json, 'utf8');
@@ -89,8 +100,29 @@ let RedisClass = null;
 let redis = null;
 let redisInitFailed = false;
 
+// After repeated failures, skip Redis for a cooldown so an outage doesn't add
+// a timed-out round-trip to every request.
+const REDIS_FAILURE_THRESHOLD = 3;
+const REDIS_COOLDOWN_MS = 10_000;
+let redisFailures = 0;
+let redisOpenUntil = 0;
+
+function recordRedisSuccess() {
+  redisFailures = 0;
+}
+
+function recordRedisFailure() {
+  redisFailures += 1;
+  if (redisFailures >= REDIS_FAILURE_THRESHOLD) {
+    redisOpenUntil = Date.now() + REDIS_COOLDOWN_MS;
+    redisFailures = 0;
+    console.warn(`[Cache] Redis unavailable, bypassing for ${REDIS_COOLDOWN_MS / 1000}s`);
+  }
+}
+
 export async function getRedis() {
   if (isSidecar) return null;
+  if (redisOpenUntil > Date.now()) return null;
   if (redis) return redis;
   if (redisInitFailed) return null;
 
@@ -103,7 +135,10 @@ export async function getRedis() {
       const mod = await import('@upstash/redis');
       RedisClass = mod.Redis;
     }
-    redis = new RedisClass({ url, token });
+    // Values are always JSON, so skip the default base64 response wrapping:
+    // it inflates payloads by a third and adds a decode pass on every read.
+    // A single retry is enough; the breaker below handles sustained outages.
+    redis = new RedisClass({ url, token, responseEncoding: false, retry: { retries: 1 } });
     return redis;
   } catch (err) {
     redisInitFailed = true;
@@ -129,8 +164,11 @@ export async function getCachedJson(key) {
   const r = await getRedis();
   if (!r) return null;
   try {
-    return await r.get(key);
+    const value = await r.get(key);
+    recordRedisSuccess();
+    return value;
   } catch (err) {
+    recordRedisFailure();
     console.warn('[Cache] Read failed:', err.message);
     return null;
   }
@@ -148,13 +186,45 @@ export async function setCachedJson(key, value, ttlSeconds) {
   if (!r) return false;
   try {
     await r.set(key, value, { ex: ttlSeconds });
+    recordRedisSuccess();
     return true;
   } catch (err) {
+    recordRedisFailure();
     console.warn('[Cache] Write failed:', err.message);
     return false;
   }
 }
 
+// Write several [key, value, ttlSeconds] entries in one pipelined round-trip
+export async function setCachedJsonMany(entries) {
+  if (entries.length === 0) return true;
+  if (isSidecar) {
+    await ensureDesktopCache();
+    const now = Date.now();
+    for (const [key, value, ttlSeconds] of entries) {
+      mem.set(key, { value, expiresAt: now + ttlSeconds * 1000 });
+    }
+    debouncedPersist();
+    return true;
+  }
+
+  const r = await getRedis();
+  if (!r) return false;
+  try {
+    const pipeline = r.pipeline();
+    for (const [key, value, ttlSeconds] of entries) {
+      pipeline.set(key, value, { ex: ttlSeconds });
+    }
+    await pipeline.exec();
+    recordRedisSuccess();
+    return true;
+  } catch (err) {
+    recordRedisFailure();
+    console.warn('[Cache] Pipelined write failed:', err.message);
+    return false;
+  }
+}
+
 export async function mget(...keys) {
   if (isSidecar) {
     await ensureDesktopCache();
@@ -169,13 +239,25 @@ export async function mget(...keys) {
   const r = await getRedis();
   if (!r) return keys.map(() => null);
   try {
-    return await r.mget(...keys);
+    const values = await r.mget(...keys);
+    recordRedisSuccess();
+    return values;
   } catch (err) {
+    recordRedisFailure();
     console.warn('[Cache] mget failed:', err.message);
     return keys.map(() => null);
   }
 }
 
+// Swap in a stand-in Redis client and reset the breaker, so tests can drive
+// the cloud path without Upstash.
+export function __setRedisClientForTests(client) {
+  redis = client;
+  redisInitFailed = false;
+  redisFailures = 0;
+  redisOpenUntil = 0;
+}
+
 export function hashString(input) {
   let hash = 5381;
   for (let i = 0; i < input.length; i++) {
@@ -0,0 +1,136 @@
+import { strict as assert } from 'node:assert';
+import test from 'node:test';
+import {
+  __setRedisClientForTests,
+  getCachedJson,
+  mget,
+  setCachedJson,
+  setCachedJsonMany,
+} from './_upstash-cache.js';
+
+function createFakeRedis({ fail = false } = {}) {
+  const calls = [];
+  const store = new Map();
+  const ttls = new Map();
+  const maybeFail = (op) => {
+    calls.push(op);
+    if (client.fail) throw new Error('upstash unavailable');
+  };
+  const client = {
+    fail,
+    calls,
+    store,
+    ttls,
+    async get(key) {
+      maybeFail('get');
+      return store.has(key) ? store.get(key) : null;
+    },
+    async set(key, value, options) {
+      maybeFail('set');
+      store.set(key, value);
+      ttls.set(key, options.ex);
+      return 'OK';
+    },
+    async mget(...keys) {
+      maybeFail('mget');
+      return keys.map((key) => (store.has(key) ? store.get(key) : null));
+    },
+    pipeline() {
+      const queued = [];
+      return {
+        set(key, value, options) {
+          queued.push([key, value, options]);
+        },
+        async exec() {
+          maybeFail(`pipeline:${queued.length}`);
+          for (const [key, value, options] of queued) {
+            store.set(key, value);
+            ttls.set(key, options.ex);
+          }
+          return queued.map(() => 'OK');
+        },
+      };
+    },
+  };
+  return client;
+}
+
+test.afterEach(() => {
+  __setRedisClientForTests(null);
+});
+
+test('setCachedJsonMany writes every entry in a single pipeline exec', async () => {
+  const redis = createFakeRedis();
+  __setRedisClientForTests(redis);
+
+  const ok = await setCachedJsonMany([
+    ['geo:a', { lat: 1 }, 60],
+    ['geo:b', { lat: 2 }, 120],
+  ]);
+
+  assert.equal(ok, true);
+  assert.deepEqual(redis.calls, ['pipeline:2']);
+  assert.deepEqual(redis.store.get('geo:a'), { lat: 1 });
+  assert.deepEqual(redis.store.get('geo:b'), { lat: 2 });
+  assert.deepEqual([...redis.ttls], [['geo:a', 60], ['geo:b', 120]]);
+});
+
+test('setCachedJsonMany skips Redis for an empty batch', async () => {
+  const redis = createFakeRedis();
+  __setRedisClientForTests(redis);
+
+  assert.equal(await setCachedJsonMany([]), true);
+  assert.deepEqual(redis.calls, []);
+});
+
+test('mget returns values in key order with nulls for misses', async () => {
+  const redis = createFakeRedis();
+  __setRedisClientForTests(redis);
+  await setCachedJson('k1', 'one', 30);
+  await setCachedJson('k3', 'three', 30);
+
+  assert.deepEqual(await mget('k1', 'k2', 'k3'), ['one', null, 'three']);
+});
+
+test('breaker bypasses Redis for the cooldown after repeated failures', async (t) => {
+  let now = Date.parse('2026-02-15T12:00:00.000Z');
+  t.mock.method(Date, 'now', () => now);
+  t.mock.method(console, 'warn', () => {});
+  const redis = createFakeRedis({ fail: true });
+  __setRedisClientForTests(redis);
+
+  assert.equal(await getCachedJson('k'), null);
+  assert.equal(await setCachedJson('k', 1, 30), false);
+  assert.deepEqual(await mget('k', 'j'), [null, null]);
+  assert.equal(redis.calls.length, 3);
+
+  // Open: no round-trips at all, every call degrades to a miss.
+  redis.fail = false;
+  assert.equal(await getCachedJson('k'), null);
+  assert.equal(await setCachedJsonMany([['k', 1, 30]]), false);
+  assert.deepEqual(await mget('k'), [null]);
+  assert.equal(redis.calls.length, 3);
+
+  now += 10_001;
+  assert.equal(await setCachedJson('k', 'back', 30), true);
+  assert.equal(await getCachedJson('k'), 'back');
+  assert.equal(redis.calls.length, 5);
+});
+
+test('a success resets the failure count before the breaker trips', async (t) => {
+  t.mock.method(console, 'warn', () => {});
+  const redis = createFakeRedis({ fail: true });
+  __setRedisClientForTests(redis);
+
+  await getCachedJson('k');
+  await getCachedJson('k');
+  redis.fail = false;
+  await setCachedJson('k', 'v', 30);
+  redis.fail = true;
+  await getCachedJson('k');
+  await getCachedJson('k');
+  redis.fail = false;
+
+  assert.equal(await getCachedJson('k'), 'v');
+  assert.equal(redis.calls.length, 6);
+});
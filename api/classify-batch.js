@@ -1,4 +1,4 @@
-import { getCachedJson, setCachedJson, mget, hashString } from './_upstash-cache.js';
+import { setCachedJsonMany, mget, hashString } from './_upstash-cache.js';
 import { getCorsHeaders, isDisallowedOrigin } from './_cors.js';
 
 export const config = {
@@ -75,29 +75,40 @@ export default async function handler(request) {
 
   const batch = titles.slice(0, MAX_BATCH_SIZE);
   const results = new Array(batch.length).fill(null);
-  const uncachedIndices = [];
-
-  const cacheKeys = batch.map(
-    (t) => `classify:${CACHE_VERSION}:${hashString(t.toLowerCase() + ':' + variant)}`
-  );
-  const cached = await mget(...cacheKeys);
-  for (let i = 0; i < cached.length; i++) {
-    const val = cached[i];
+
+  // The same headline often arrives from several feeds in one batch. Group
+  // indices by cache key so each distinct headline is looked up and sent to
+  // the model once, then fan the result back out to every position.
+  const indicesByKey = new Map();
+  for (let i = 0; i < batch.length; i++) {
+    const key = `classify:${CACHE_VERSION}:${hashString(batch[i].toLowerCase() + ':' + variant)}`;
+    const indices = indicesByKey.get(key);
+    if (indices) indices.push(i);
+    else indicesByKey.set(key, [i]);
+  }
+
+  const uniqueKeys = [...indicesByKey.keys()];
+  const uncachedKeys = [];
+  const cached = await mget(...uniqueKeys);
+  for (let k = 0; k < uniqueKeys.length; k++) {
+    const val = cached[k];
     if (val && typeof val === 'object' && val.level) {
-      results[i] = { level: val.level, category: val.category, cached: true };
+      for (const i of indicesByKey.get(uniqueKeys[k])) {
+        results[i] = { level: val.level, category: val.category, cached: true };
+      }
     } else {
-      uncachedIndices.push(i);
+      uncachedKeys.push(uniqueKeys[k]);
     }
   }
 
-  if (uncachedIndices.length === 0) {
+  if (uncachedKeys.length === 0) {
     return new Response(JSON.stringify({ results }), {
       status: 200,
       headers: { 'Content-Type': 'application/json', 'Cache-Control': 'public, max-age=3600, s-maxage=3600, stale-while-revalidate=600' },
     });
   }
 
-  const uncachedTitles = uncachedIndices.map((i) => batch[i]);
+  const uncachedTitles = uncachedKeys.map((key) => batch[indicesByKey.get(key)[0]]);
   const isTech = variant === 'tech';
   const numberedList = uncachedTitles.map((t, i) => `${i + 1}. ${t}`).join('\n');
 
@@ -163,7 +174,8 @@ Return a JSON array with one object per headline in order: [{"level":"...","cate
     }
 
     const cacheWrites = [];
-    for (let i = 0; i < uncachedIndices.length; i++) {
+    const now = Date.now();
+    for (let i = 0; i < uncachedKeys.length; i++) {
       const classification = parsed[i];
       if (!classification) continue;
 
@@ -171,18 +183,16 @@ Return a JSON array with one object per headline in order: [{"level":"...","cate
       const category = VALID_CATEGORIES.includes(classification.category) ? classification.category : null;
       if (!level || !category) continue;
 
-      const idx = uncachedIndices[i];
-      results[idx] = { level, category, cached: false };
+      const key = uncachedKeys[i];
+      for (const idx of indicesByKey.get(key)) {
+        results[idx] = { level, category, cached: false };
+      }
 
-      const cacheKey = `classify:${CACHE_VERSION}:${hashString(batch[idx].toLowerCase() + ':' + variant)}`;
-      cacheWrites.push(
-        setCachedJson(cacheKey, { level, category, timestamp: Date.now() }, CACHE_TTL_SECONDS)
-      );
+      cacheWrites.push([key, { level, category, timestamp: now }, CACHE_TTL_SECONDS]);
     }
 
-    if (cacheWrites.length > 0) {
-      await Promise.allSettled(cacheWrites);
-    }
+    // One pipelined write for the whole batch instead of a round-trip per title
+    await setCachedJsonMany(cacheWrites);
 
     return new Response(JSON.stringify({ results }), {
       status: 200,
@@ -1,5 +1,5 @@
 import { getCorsHeaders, isDisallowedOrigin } from './_cors.js';
-import { getCachedJson, setCachedJson } from './_upstash-cache.js';
+import { getCachedJson, setCachedJson, setCachedJsonMany, mget } from './_upstash-cache.js';
 import { recordCacheTelemetry } from './_cache-telemetry.js';
 import { createIpRateLimiter } from './_ip-rate-limit.js';
 
@@ -506,24 +506,8 @@ async function fetchJsonWithTimeout(url, init = {}, timeoutMs = UPSTREAM_TIMEOUT
   }
 }
 
-async function getGeoFromCache(ip) {
-  const fromMemory = getGeoMemory(ip);
-  if (isValidGeo(fromMemory)) return fromMemory;
-
-  const cacheKey = `${GEO_CACHE_KEY_PREFIX}${ip}`;
-  const fromRedis = await getCachedJson(cacheKey);
-  if (isValidGeo(fromRedis)) {
-    setGeoMemory(ip, fromRedis);
-    return fromRedis;
-  }
-
-  return null;
-}
-
-async function setGeoCache(ip, geo) {
-  setGeoMemory(ip, geo);
-  const cacheKey = `${GEO_CACHE_KEY_PREFIX}${ip}`;
-  void setCachedJson(cacheKey, geo, GEO_CACHE_TTL_SECONDS);
+function geoCacheKey(ip) {
+  return `${GEO_CACHE_KEY_PREFIX}${ip}`;
 }
 
 async function fetchGeoIp(ip) {
@@ -565,21 +549,10 @@ async function fetchGeoIp(ip) {
   }
 }
 
-async function geolocateIp(ip) {
-  const cached = await getGeoFromCache(ip);
-  if (cached) return cached;
+// Cache operations used for geo lookups; tests pass their own to observe them
+const GEO_CACHE = { mget, setCachedJsonMany };
 
-  try {
-    const geo = await fetchGeoIp(ip);
-    if (!geo) return null;
-    await setGeoCache(ip, geo);
-    return geo;
-  } catch {
-    return null;
-  }
-}
-
-async function hydrateThreatCoordinates(threats) {
+async function hydrateThreatCoordinates(threats, { cache = GEO_CACHE, timeoutMs = GEO_OVERALL_TIMEOUT_MS } = {}) {
   const unresolvedIps = [];
   const seenIps = new Set();
 
@@ -596,23 +569,52 @@ async function hydrateThreatCoordinates(threats) {
 
   const cappedIps = unresolvedIps.slice(0, GEO_MAX_UNRESOLVED_PER_RUN);
   const resolvedByIp = new Map();
+  const recordGeo = (ip, geo) => {
+    setGeoMemory(ip, geo);
+    resolvedByIp.set(ip, geo);
+  };
+
+  // Memory first, then every remaining IP in one Redis MGET rather than a read
+  // per IP; only the misses go to the geo APIs.
+  const notInMemory = [];
+  for (const ip of cappedIps) {
+    const fromMemory = getGeoMemory(ip);
+    if (isValidGeo(fromMemory)) resolvedByIp.set(ip, fromMemory);
+    else notInMemory.push(ip);
+  }
+
+  const queue = [];
+  if (notInMemory.length > 0) {
+    const fromRedis = await cache.mget(...notInMemory.map(geoCacheKey));
+    notInMemory.forEach((ip, i) => {
+      if (isValidGeo(fromRedis[i])) recordGeo(ip, fromRedis[i]);
+      else queue.push(ip);
+    });
+  }
 
-  const queue = [...cappedIps];
+  const geoWrites = [];
   const workerCount = Math.min(GEO_CONCURRENCY, queue.length);
   const workers = Array.from({ length: workerCount }, async () => {
     while (queue.length > 0) {
       const ip = queue.shift();
       if (!ip) continue;
-      const geo = await geolocateIp(ip);
+      const geo = await fetchGeoIp(ip).catch(() => null);
       if (geo) {
-        resolvedByIp.set(ip, geo);
+        recordGeo(ip, geo);
+        geoWrites.push([geoCacheKey(ip), geo, GEO_CACHE_TTL_SECONDS]);
       }
     }
   });
 
+  // Newly resolved IPs are written back together in one pipelined round-trip.
+  // Chained on the workers rather than the race below, so lookups that land
+  // after the response deadline are still cached for the next instance.
+  const allWorkers = Promise.all(workers);
+  void allWorkers.then(() => cache.setCachedJsonMany(geoWrites));
+
   await Promise.race([
-    Promise.all(workers),
-    new Promise((resolve) => setTimeout(resolve, GEO_OVERALL_TIMEOUT_MS)),
+    allWorkers,
+    new Promise((resolve) => setTimeout(resolve, timeoutMs)),
   ]);
 
   return threats.map((threat) => {
@@ -883,6 +885,10 @@ async function fetchC2IntelSource(limit) {
   }
 }
 
+export function __testHydrateThreatCoordinates(threats, options) {
+  return hydrateThreatCoordinates(threats, options);
+}
+
 export function __resetCyberThreatsState() {
   responseMemoryCache.clear();
   staleFallbackCache.clear();
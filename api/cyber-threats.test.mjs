@@ -3,6 +3,7 @@ import test from 'node:test';
 import handler, {
   __resetCyberThreatsState,
   __testDedupeThreats,
+  __testHydrateThreatCoordinates,
   __testParseFeodoRecords,
 } from './cyber-threats.js';
 
@@ -369,3 +370,68 @@ test('API returns stale fallback when upstream fails after fresh cache TTL', asy
     Date.now = originalDateNow;
   }
 });
+
+function ipThreat(indicator) {
+  return { id: indicator, source: 'c2intel', indicatorType: 'ip', indicator, lat: null, lon: null, country: null };
+}
+
+function recordingGeoCache(cachedByKey = {}) {
+  const calls = { mget: [], writes: [] };
+  return {
+    calls,
+    cache: {
+      mget: async (...keys) => {
+        calls.mget.push(keys);
+        return keys.map((key) => cachedByKey[key] ?? null);
+      },
+      setCachedJsonMany: async (entries) => {
+        calls.writes.push(entries);
+        return true;
+      },
+    },
+  };
+}
+
+test('geo hydration reads all IPs in one mget and writes only fresh lookups in one batch', async () => {
+  const { cache, calls } = recordingGeoCache({
+    'cyber-threats:geoip:v1:1.1.1.1': { lat: 10, lon: 20, country: 'AU' },
+  });
+  const lookedUp = [];
+  globalThis.fetch = async (url) => {
+    const target = String(url);
+    lookedUp.push(target);
+    if (target.includes('ipinfo.io')) return jsonResponse({ loc: '48.85,2.35', country: 'FR' });
+    return new Response('not found', { status: 404 });
+  };
+
+  const hydrated = await __testHydrateThreatCoordinates(
+    [ipThreat('1.1.1.1'), ipThreat('2.2.2.2'), ipThreat('2.2.2.2')],
+    { cache },
+  );
+  await new Promise((resolve) => setImmediate(resolve));
+
+  assert.deepEqual(calls.mget, [['cyber-threats:geoip:v1:1.1.1.1', 'cyber-threats:geoip:v1:2.2.2.2']]);
+  assert.equal(lookedUp.length, 1);
+  assert.equal(lookedUp[0].includes('2.2.2.2'), true);
+  assert.equal(hydrated[0].lat, 10);
+  assert.equal(hydrated[1].lat, 48.85);
+  assert.equal(calls.writes.length, 1);
+  assert.deepEqual(calls.writes[0].map(([key]) => key), ['cyber-threats:geoip:v1:2.2.2.2']);
+});
+
+test('geo lookups that finish after the deadline are still written back', async () => {
+  const { cache, calls } = recordingGeoCache();
+  globalThis.fetch = async (url) => {
+    await new Promise((resolve) => setTimeout(resolve, 50));
+    if (String(url).includes('ipinfo.io')) return jsonResponse({ loc: '1,2', country: 'US' });
+    return new Response('not found', { status: 404 });
+  };
+
+  const hydrated = await __testHydrateThreatCoordinates([ipThreat('3.3.3.3')], { cache, timeoutMs: 5 });
+  assert.equal(hydrated[0].lat, null);
+  assert.equal(calls.writes.length, 0);
+
+  await new Promise((resolve) => setTimeout(resolve, 100));
+  assert.equal(calls.writes.length, 1);
+  assert.deepEqual(calls.writes[0][0][1], { lat: 1, lon: 2, country: 'US' });
+});
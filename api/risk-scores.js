@@ -4,7 +4,7 @@
  * Uses Upstash Redis for cross-user caching (10-minute TTL)
  */
 
-import { getCachedJson, setCachedJson } from './_upstash-cache.js';
+import { getCachedJson, setCachedJsonMany } from './_upstash-cache.js';
 import { getCorsHeaders, isDisallowedOrigin } from './_cors.js';
 
 export const config = {
@@ -295,9 +295,9 @@ export default async function handler(request) {
     };
 
     // Cache (both regular and stale backup)
-    await Promise.all([
-      setCachedJson(CACHE_KEY, result, CACHE_TTL_SECONDS),
-      setCachedJson(STALE_CACHE_KEY, result, STALE_CACHE_TTL_SECONDS),
+    await setCachedJsonMany([
+      [CACHE_KEY, result, CACHE_TTL_SECONDS],
+      [STALE_CACHE_KEY, result, STALE_CACHE_TTL_SECONDS],
     ]);
 
     return new Response(JSON.stringify({
@@ -179,6 +179,75 @@ const ALLOWED_DOMAINS = [
   'cointelegraph.com',
 ];
 
+const UPSTREAM_HEADERS = {
+  'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+  'Accept': 'application/rss+xml, application/xml, text/xml, */*',
+  'Accept-Language': 'en-US,en;q=0.9',
+};
+
+// Real feeds are well under 1 MB; a body past this is a misbehaving origin and
+// would otherwise be relayed in full and parsed on the client's main thread.
+const MAX_FEED_BYTES = 10 * 1024 * 1024;
+
+const VALIDATOR_HEADERS = [
+  ['if-none-match', 'ETag'],
+  ['if-modified-since', 'Last-Modified'],
+];
+
+// Forward the client's conditional-request validators so an unchanged feed
+// comes back from the origin as a bodyless 304 instead of a full download.
+function buildUpstreamHeaders(req) {
+  const headers = { ...UPSTREAM_HEADERS };
+  for (const [requestHeader] of VALIDATOR_HEADERS) {
+    const value = req.headers.get(requestHeader);
+    if (value) headers[requestHeader] = value;
+  }
+  return headers;
+}
+
+// Count bytes as they stream through and abort the upstream download once the
+// body passes MAX_FEED_BYTES (covers origins that omit Content-Length).
+function capFeedBody(body) {
+  let received = 0;
+  return body.pipeThrough(new TransformStream({
+    transform(chunk, controller) {
+      received += chunk.byteLength;
+      if (received > MAX_FEED_BYTES) {
+        controller.error(new Error('Feed exceeds size limit'));
+        return;
+      }
+      controller.enqueue(chunk);
+    },
+  }));
+}
+
+// Pass the upstream body through as a stream: no buffering the whole feed
+// into a string first, and the client starts receiving bytes immediately.
+// ETag / Last-Modified are passed back so the browser can revalidate later.
+function feedResponse(upstream, corsHeaders) {
+  const declaredLength = Number(upstream.headers.get('content-length'));
+  if (declaredLength > MAX_FEED_BYTES) {
+    void upstream.body?.cancel();
+    return new Response(JSON.stringify({ error: 'Feed too large' }), {
+      status: 502,
+      headers: { 'Content-Type': 'application/json', ...corsHeaders },
+    });
+  }
+
+  const headers = {
+    'Content-Type': 'application/xml',
+    'Cache-Control': 'public, max-age=300, s-maxage=300, stale-while-revalidate=60',
+    ...corsHeaders,
+  };
+  for (const [, responseHeader] of VALIDATOR_HEADERS) {
+    const value = upstream.headers.get(responseHeader);
+    if (value) headers[responseHeader] = value;
+  }
+  const notModified = upstream.status === 304;
+  const body = notModified || !upstream.body ? null : capFeedBody(upstream.body);
+  return new Response(body, { status: upstream.status, headers });
+}
+
 export default async function handler(req) {
   const corsHeaders = getCorsHeaders(req, 'GET, OPTIONS');
 
@@ -211,13 +280,10 @@ export default async function handler(req) {
     // Google News is slow - use longer timeout
     const isGoogleNews = feedUrl.includes('news.google.com');
     const timeout = isGoogleNews ? 20000 : 12000;
+    const upstreamHeaders = buildUpstreamHeaders(req);
 
     const response = await fetchWithTimeout(feedUrl, {
-      headers: {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'application/rss+xml, application/xml, text/xml, */*',
-        'Accept-Language': 'en-US,en;q=0.9',
-      },
+      headers: upstreamHeaders,
       redirect: 'manual',
     }, timeout);
 
@@ -233,21 +299,9 @@ export default async function handler(req) {
             });
           }
           const redirectResponse = await fetchWithTimeout(redirectUrl.href, {
-            headers: {
-              'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-              'Accept': 'application/rss+xml, application/xml, text/xml, */*',
-              'Accept-Language': 'en-US,en;q=0.9',
-            },
+            headers: upstreamHeaders,
           }, timeout);
-          const data = await redirectResponse.text();
-          return new Response(data, {
-            status: redirectResponse.status,
-            headers: {
-              'Content-Type': 'application/xml',
-              'Cache-Control': 'public, max-age=300, s-maxage=300, stale-while-revalidate=60',
-              ...corsHeaders,
-            },
-          });
+          return feedResponse(redirectResponse, corsHeaders);
         } catch {
           return new Response(JSON.stringify({ error: 'Invalid redirect' }), {
             status: 502,
@@ -257,15 +311,7 @@ export default async function handler(req) {
       }
     }
 
-    const data = await response.text();
-    return new Response(data, {
-      status: response.status,
-      headers: {
-        'Content-Type': 'application/xml',
-        'Cache-Control': 'public, max-age=300, s-maxage=300, stale-while-revalidate=60',
-        ...corsHeaders,
-      },
-    });
+    return feedResponse(response, corsHeaders);
   } catch (error) {
     const isTimeout = error.name === 'AbortError';
     console.error('RSS proxy error:', feedUrl, error.message);
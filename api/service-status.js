@@ -45,6 +45,9 @@ const SERVICES = [
   { id: 'supabase', name: 'Supabase', statusPage: 'https://status.supabase.com/api/v2/status.json', category: 'saas' },
 ];
 
+// Cap concurrent status page requests to avoid a burst of ~30 TLS handshakes per call
+const MAX_CONCURRENT_CHECKS = 10;
+
 // Statuspage.io API returns status like: none, minor, major, critical
 function normalizeStatus(indicator) {
   if (!indicator) return 'unknown';
@@ -64,9 +67,14 @@ function normalizeStatus(indicator) {
   return 'unknown';
 }
 
+// Build only the fields the response exposes instead of spreading the full service config
+function serviceResult(service, status, description) {
+  return { id: service.id, name: service.name, category: service.category, status, description };
+}
+
 async function checkStatusPage(service) {
   if (!service.statusPage) {
-    return { ...service, status: 'unknown', description: 'No API available' };
+    return serviceResult(service, 'unknown', 'No API available');
   }
 
   try {
@@ -87,7 +95,7 @@ async function checkStatusPage(service) {
     });
 
     if (!response.ok) {
-      return { ...service, status: 'unknown', description: `HTTP ${response.status}` };
+      return serviceResult(service, 'unknown', `HTTP ${response.status}`);
     }
 
     // Handle custom parsers
@@ -98,15 +106,15 @@ async function checkStatusPage(service) {
         i.end === undefined || new Date(i.end) > new Date()
       ) : [];
       if (activeIncidents.length === 0) {
-        return { ...service, status: 'operational', description: 'All services operational' };
+        return serviceResult(service, 'operational', 'All services operational');
       }
       const severity = activeIncidents.some(i => i.severity === 'high') ? 'outage' : 'degraded';
-      return { ...service, status: severity, description: `${activeIncidents.length} active incident(s)` };
+      return serviceResult(service, severity, `${activeIncidents.length} active incident(s)`);
     }
 
     if (service.customParser === 'aws') {
       // AWS status page is complex HTML - assume operational if reachable
-      return { ...service, status: 'operational', description: 'Status page reachable' };
+      return serviceResult(service, 'operational', 'Status page reachable');
     }
 
     if (service.customParser === 'rss') {
@@ -114,11 +122,11 @@ async function checkStatusPage(service) {
       const text = await response.text();
       const hasRecentIncident = text.includes('<item>') &&
         (text.includes('degradation') || text.includes('outage') || text.includes('incident'));
-      return {
-        ...service,
-        status: hasRecentIncident ? 'degraded' : 'operational',
-        description: hasRecentIncident ? 'Recent incidents reported' : 'No recent incidents'
-      };
+      return serviceResult(
+        service,
+        hasRecentIncident ? 'degraded' : 'operational',
+        hasRecentIncident ? 'Recent incidents reported' : 'No recent incidents'
+      );
     }
 
     if (service.customParser === 'instatus') {
@@ -126,11 +134,11 @@ async function checkStatusPage(service) {
       const data = await response.json();
       const pageStatus = data.page?.status;
       if (pageStatus === 'UP') {
-        return { ...service, status: 'operational', description: 'All systems operational' };
+        return serviceResult(service, 'operational', 'All systems operational');
       } else if (pageStatus === 'HASISSUES') {
-        return { ...service, status: 'degraded', description: 'Some issues reported' };
+        return serviceResult(service, 'degraded', 'Some issues reported');
       } else {
-        return { ...service, status: 'unknown', description: pageStatus || 'Unknown' };
+        return serviceResult(service, 'unknown', pageStatus || 'Unknown');
       }
     }
 
@@ -140,38 +148,38 @@ async function checkStatusPage(service) {
       const overall = data.result?.status_overall;
       const statusCode = overall?.status_code;
       if (statusCode === 100) {
-        return { ...service, status: 'operational', description: overall.status || 'All systems operational' };
+        return serviceResult(service, 'operational', overall.status || 'All systems operational');
       } else if (statusCode >= 300 && statusCode < 500) {
-        return { ...service, status: 'degraded', description: overall.status || 'Degraded performance' };
+        return serviceResult(service, 'degraded', overall.status || 'Degraded performance');
       } else if (statusCode >= 500) {
-        return { ...service, status: 'outage', description: overall.status || 'Service disruption' };
+        return serviceResult(service, 'outage', overall.status || 'Service disruption');
       }
-      return { ...service, status: 'unknown', description: overall?.status || 'Unknown status' };
+      return serviceResult(service, 'unknown', overall?.status || 'Unknown status');
     }
 
     if (service.customParser === 'slack') {
       // Slack custom API format
       const data = await response.json();
       if (data.status === 'ok') {
-        return { ...service, status: 'operational', description: 'All systems operational' };
+        return serviceResult(service, 'operational', 'All systems operational');
       } else if (data.status === 'active' || data.active_incidents?.length > 0) {
         const count = data.active_incidents?.length || 1;
-        return { ...service, status: 'degraded', description: `${count} active incident(s)` };
+        return serviceResult(service, 'degraded', `${count} active incident(s)`);
       }
-      return { ...service, status: 'unknown', description: data.status || 'Unknown' };
+      return serviceResult(service, 'unknown', data.status || 'Unknown');
     }
 
     if (service.customParser === 'stripe') {
       // Stripe custom API format at /current
       const data = await response.json();
       if (data.largestatus === 'up') {
-        return { ...service, status: 'operational', description: data.message || 'All systems operational' };
+        return serviceResult(service, 'operational', data.message || 'All systems operational');
       } else if (data.largestatus === 'degraded') {
-        return { ...service, status: 'degraded', description: data.message || 'Degraded performance' };
+        return serviceResult(service, 'degraded', data.message || 'Degraded performance');
       } else if (data.largestatus === 'down') {
-        return { ...service, status: 'outage', description: data.message || 'Service disruption' };
+        return serviceResult(service, 'outage', data.message || 'Service disruption');
       }
-      return { ...service, status: 'unknown', description: data.message || 'Unknown' };
+      return serviceResult(service, 'unknown', data.message || 'Unknown');
     }
 
     if (service.customParser === 'incidentio') {
@@ -182,13 +190,13 @@ async function checkStatusPage(service) {
         // Try parsing HTML for status - incident.io pages have status in HTML
         const operationalMatch = text.match(/All Systems Operational|fully operational|no issues/i);
         if (operationalMatch) {
-          return { ...service, status: 'operational', description: 'All systems operational' };
+          return serviceResult(service, 'operational', 'All systems operational');
         }
         const degradedMatch = text.match(/degraded|partial outage|experiencing issues/i);
         if (degradedMatch) {
-          return { ...service, status: 'degraded', description: 'Some issues reported' };
+          return serviceResult(service, 'degraded', 'Some issues reported');
         }
-        return { ...service, status: 'unknown', description: 'Could not parse status' };
+        return serviceResult(service, 'unknown', 'Could not parse status');
       }
       // Parse JSON response
       try {
@@ -196,15 +204,15 @@ async function checkStatusPage(service) {
         const indicator = data.status?.indicator || '';
         const description = data.status?.description || '';
         if (indicator === 'none' || description.toLowerCase().includes('operational')) {
-          return { ...service, status: 'operational', description: description || 'All systems operational' };
+          return serviceResult(service, 'operational', description || 'All systems operational');
         } else if (indicator === 'minor' || indicator === 'maintenance') {
-          return { ...service, status: 'degraded', description: description || 'Minor issues' };
+          return serviceResult(service, 'degraded', description || 'Minor issues');
         } else if (indicator === 'major' || indicator === 'critical') {
-          return { ...service, status: 'outage', description: description || 'Major outage' };
+          return serviceResult(service, 'outage', description || 'Major outage');
         }
-        return { ...service, status: 'operational', description: description || 'Status OK' };
+        return serviceResult(service, 'operational', description || 'Status OK');
       } catch {
-        return { ...service, status: 'unknown', description: 'Invalid response' };
+        return serviceResult(service, 'unknown', 'Invalid response');
       }
     }
 
@@ -212,14 +220,14 @@ async function checkStatusPage(service) {
 
     // Check if we got HTML instead of JSON (blocked/redirected)
     if (text.startsWith('<!') || text.startsWith('<html')) {
-      return { ...service, status: 'unknown', description: 'Blocked by service' };
+      return serviceResult(service, 'unknown', 'Blocked by service');
     }
 
     let data;
     try {
       data = JSON.parse(text);
     } catch {
-      return { ...service, status: 'unknown', description: 'Invalid JSON response' };
+      return serviceResult(service, 'unknown', 'Invalid JSON response');
     }
 
     // Handle different API formats
@@ -242,12 +250,51 @@ async function checkStatusPage(service) {
       description = 'Unknown format';
     }
 
-    return { ...service, status, description };
+    return serviceResult(service, status, description);
   } catch (error) {
-    return { ...service, status: 'unknown', description: error.message || 'Request failed' };
+    return serviceResult(service, 'unknown', error.message || 'Request failed');
   }
 }
 
+// Check services with at most `limit` requests in flight, reporting each result as it settles.
+// Results are returned in input order regardless of completion order.
+async function checkServicesBounded(services, limit, onResult) {
+  const results = new Array(services.length);
+  let next = 0;
+  async function worker() {
+    while (next < services.length) {
+      const index = next++;
+      const result = await checkStatusPage(services[index]);
+      results[index] = result;
+      onResult?.(result);
+    }
+  }
+  await Promise.all(Array.from({ length: Math.min(limit, services.length) }, worker));
+  return results;
+}
+
+// Stream one JSON line per service as soon as its check completes
+function streamServiceStatus(servicesToCheck, cors) {
+  const encoder = new TextEncoder();
+  const stream = new ReadableStream({
+    async start(controller) {
+      await checkServicesBounded(servicesToCheck, MAX_CONCURRENT_CHECKS, (result) => {
+        controller.enqueue(encoder.encode(JSON.stringify(result) + '\n'));
+      });
+      controller.close();
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': 'application/x-ndjson',
+      ...cors,
+      'Cache-Control': 'no-store',
+      'Vary': `${cors.Vary}, Accept`,
+    },
+  });
+}
+
 export default async function handler(req) {
   const cors = getCorsHeaders(req);
   if (isDisallowedOrigin(req)) {
@@ -261,8 +308,13 @@ export default async function handler(req) {
     servicesToCheck = SERVICES.filter(s => s.category === category);
   }
 
-  // Check all services in parallel
-  const results = await Promise.all(servicesToCheck.map(checkStatusPage));
+  const wantsStream = url.searchParams.get('stream') === '1'
+    || (req.headers.get('accept') || '').includes('application/x-ndjson');
+  if (wantsStream) {
+    return streamServiceStatus(servicesToCheck, cors);
+  }
+
+  const results = await checkServicesBounded(servicesToCheck, MAX_CONCURRENT_CHECKS);
 
   // Sort by status (outages first, then degraded, then operational)
   const statusOrder = { outage: 0, degraded: 1, unknown: 2, operational: 3 };
@@ -279,18 +331,14 @@ export default async function handler(req) {
     success: true,
     timestamp: new Date().toISOString(),
     summary,
-    services: results.map(r => ({
-      id: r.id,
-      name: r.name,
-      category: r.category,
-      status: r.status,
-      description: r.description,
-    })),
+    services: results,
   }), {
     headers: {
       'Content-Type': 'application/json',
       ...cors,
       'Cache-Control': 'public, max-age=60, s-maxage=60, stale-while-revalidate=30', // 1 min cache
+      // The body format depends on Accept, so caches must key on it too
+      'Vary': `${cors.Vary}, Accept`,
     },
   });
 }
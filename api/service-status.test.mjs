@@ -0,0 +1,95 @@
+import { strict as assert } from 'node:assert';
+import test from 'node:test';
+import handler from './service-status.js';
+
+const ORIGINAL_FETCH = globalThis.fetch;
+const CLOUD_IDS = ['aws', 'azure', 'gcp', 'cloudflare', 'vercel', 'netlify', 'digitalocean', 'render', 'railway'];
+
+function makeRequest(query, headers = {}) {
+  return new Request(`http://46.62.167.252/api/service-status${query}`, { headers });
+}
+
+function jsonResponse(body) {
+  return new Response(JSON.stringify(body), {
+    status: 200,
+    headers: { 'content-type': 'application/json' },
+  });
+}
+
+// Every status page reports healthy; `delayFor` lets a test reorder completions.
+function createMockFetch({ delayFor = () => 0, onStart, onEnd } = {}) {
+  return async (url) => {
+    const target = String(url);
+    onStart?.(target);
+    await new Promise((resolve) => setTimeout(resolve, delayFor(target)));
+    onEnd?.(target);
+    if (target.includes('status.cloud.google.com')) return jsonResponse([]);
+    if (target.includes('instatus.com')) return jsonResponse({ page: { status: 'UP' } });
+    return jsonResponse({ status: { indicator: 'none', description: 'All Systems Operational' } });
+  };
+}
+
+// Cloud services listed earlier finish later, so completion order is reversed.
+function reverseCompletionDelay(target) {
+  const hosts = ['aws', 'azure', 'google', 'cloudflare', 'vercel', 'netlify', 'digitalocean', 'render', 'railway'];
+  const index = hosts.findIndex((host) => target.includes(host));
+  return index === -1 ? 0 : (hosts.length - index) * 5;
+}
+
+test.afterEach(() => {
+  globalThis.fetch = ORIGINAL_FETCH;
+});
+
+test('JSON response keeps configured order for equal statuses and varies on Accept', async () => {
+  globalThis.fetch = createMockFetch({ delayFor: reverseCompletionDelay });
+
+  const response = await handler(makeRequest('?category=cloud'));
+  assert.equal(response.status, 200);
+  assert.equal(response.headers.get('content-type'), 'application/json');
+  assert.equal(response.headers.get('vary'), 'Origin, Accept');
+
+  const body = await response.json();
+  assert.deepEqual(body.services.map((s) => s.id), CLOUD_IDS);
+  assert.equal(body.summary.operational, CLOUD_IDS.length);
+});
+
+test('status checks never exceed the concurrency cap', async () => {
+  let inFlight = 0;
+  let peak = 0;
+  globalThis.fetch = createMockFetch({
+    delayFor: () => 2,
+    onStart: () => { inFlight += 1; peak = Math.max(peak, inFlight); },
+    onEnd: () => { inFlight -= 1; },
+  });
+
+  const body = await (await handler(makeRequest('?category=all'))).json();
+  assert.ok(body.services.length > 10);
+  assert.equal(peak, 10);
+});
+
+test('stream=1 returns one NDJSON line per service in completion order', async () => {
+  globalThis.fetch = createMockFetch({ delayFor: reverseCompletionDelay });
+
+  const response = await handler(makeRequest('?category=cloud&stream=1'));
+  assert.equal(response.headers.get('content-type'), 'application/x-ndjson');
+  assert.equal(response.headers.get('cache-control'), 'no-store');
+  assert.equal(response.headers.get('vary'), 'Origin, Accept');
+
+  const text = await response.text();
+  assert.ok(text.endsWith('\n'));
+  const lines = text.trimEnd().split('\n').map((line) => JSON.parse(line));
+  assert.deepEqual(lines.map((s) => s.id), [...CLOUD_IDS].reverse());
+  for (const line of lines) {
+    assert.deepEqual(Object.keys(line), ['id', 'name', 'category', 'status', 'description']);
+    assert.equal(line.status, 'operational');
+  }
+});
+
+test('Accept: application/x-ndjson selects the stream without the query flag', async () => {
+  globalThis.fetch = createMockFetch();
+
+  const response = await handler(makeRequest('?category=cloud', { accept: 'application/x-ndjson' }));
+  assert.equal(response.headers.get('content-type'), 'application/x-ndjson');
+  const lines = (await response.text()).trimEnd().split('\n');
+  assert.equal(lines.length, CLOUD_IDS.length);
+});
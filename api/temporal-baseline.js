@@ -7,7 +7,7 @@
  * POST { updates: [{ type, region, count }] } — batch update baselines
  */
 
-import { getCachedJson, setCachedJson, mget } from './_upstash-cache.js';
+import { getCachedJson, setCachedJsonMany, mget } from './_upstash-cache.js';
 import { getCorsHeaders, isDisallowedOrigin } from './_cors.js';
 
 export const config = {
@@ -150,16 +150,16 @@ async function handlePost(request) {
     const delta2 = count - newMean;
     const newM2 = prev.m2 + delta * delta2;
 
-    writes.push(setCachedJson(keys[i], {
+    writes.push([keys[i], {
       mean: newMean,
       m2: newM2,
       sampleCount: n,
       lastUpdated: now.toISOString(),
-    }, BASELINE_TTL));
+    }, BASELINE_TTL]);
   }
 
   if (writes.length > 0) {
-    await Promise.all(writes);
+    await setCachedJsonMany(writes);
   }
 
   return json({ updated: writes.length });
@@ -4,7 +4,7 @@
  * TTL: 5 minutes (matches OpenSky refresh rate)
  */
 
-import { getCachedJson, setCachedJson } from './_upstash-cache.js';
+import { getCachedJson, setCachedJsonMany } from './_upstash-cache.js';
 import { getCorsHeaders, isDisallowedOrigin } from './_cors.js';
 
 export const config = {
@@ -550,10 +550,10 @@ export default async function handler(req) {
     };
 
     // Cache the result (regular, stale, and long-term backup)
-    await Promise.all([
-      setCachedJson(CACHE_KEY, result, CACHE_TTL_SECONDS),
-      setCachedJson(STALE_CACHE_KEY, result, STALE_CACHE_TTL_SECONDS),
-      setCachedJson(BACKUP_CACHE_KEY, result, BACKUP_CACHE_TTL_SECONDS),
+    await setCachedJsonMany([
+      [CACHE_KEY, result, CACHE_TTL_SECONDS],
+      [STALE_CACHE_KEY, result, STALE_CACHE_TTL_SECONDS],
+      [BACKUP_CACHE_KEY, result, BACKUP_CACHE_TTL_SECONDS],
     ]);
 
     return Response.json(result, {
@@ -565,7 +565,8 @@ export default async function handler(req) {
   } catch (error) {
     console.warn('[TheaterPosture] Error:', error.message);
 
-    // Try to return cached data when API fails (stale first, then backup)
+    // Try to return cached data when API fails (stale first, then backup).
+    // The backup is only read when the stale copy is gone.
     const stale = await getCachedJson(STALE_CACHE_KEY);
     if (stale) {
       console.log('[TheaterPosture] Returning stale cached data (24h) due to API error');
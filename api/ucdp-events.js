@@ -12,7 +12,20 @@ const UCDP_PAGE_SIZE = 1000;
 const MAX_PAGES = 12;
 const TRAILING_WINDOW_MS = 365 * 24 * 60 * 60 * 1000;
 
-let fallbackCache = { data: null, timestamp: 0 };
+// `body` is the result serialized once when it is stored, so memory hits and
+// stale fallbacks send it as-is instead of re-encoding ~10k events each time.
+let fallbackCache = { data: null, body: '', timestamp: 0 };
+
+function rememberResult(result, timestamp) {
+  fallbackCache = { data: result, body: JSON.stringify(result), timestamp };
+}
+
+function cachedBodyResponse(headers) {
+  return new Response(fallbackCache.body, {
+    status: 200,
+    headers: { 'Content-Type': 'application/json', ...headers },
+  });
+}
 
 const rateLimiter = createIpRateLimiter({
   limit: 15,
@@ -130,22 +143,20 @@ export default async function handler(req) {
     });
   }
 
+  // Memory first: a fresh in-instance copy skips the Redis round-trip and the
+  // decode/re-encode of the whole payload.
   const now = Date.now();
+  if (isValidResult(fallbackCache.data) && now - fallbackCache.timestamp < CACHE_TTL_MS) {
+    recordCacheTelemetry('/api/ucdp-events', 'MEMORY-HIT');
+    return cachedBodyResponse({ ...corsHeaders, 'Cache-Control': 'public, max-age=3600, s-maxage=3600, stale-while-revalidate=600', 'X-Cache': 'MEMORY-HIT' });
+  }
+
   const cached = await getCachedJson(CACHE_KEY);
   if (isValidResult(cached)) {
     recordCacheTelemetry('/api/ucdp-events', 'REDIS-HIT');
-    return Response.json(cached, {
-      status: 200,
-      headers: { ...corsHeaders, 'Cache-Control': 'public, max-age=3600, s-maxage=3600, stale-while-revalidate=600', 'X-Cache': 'REDIS-HIT' },
-    });
-  }
-
-  if (isValidResult(fallbackCache.data) && now - fallbackCache.timestamp < CACHE_TTL_MS) {
-    recordCacheTelemetry('/api/ucdp-events', 'MEMORY-HIT');
-    return Response.json(fallbackCache.data, {
-      status: 200,
-      headers: { ...corsHeaders, 'Cache-Control': 'public, max-age=3600, s-maxage=3600, stale-while-revalidate=600', 'X-Cache': 'MEMORY-HIT' },
-    });
+    // Age the memory copy from when the result was built, not from this read.
+    rememberResult(cached, Date.parse(cached.cached_at) || now);
+    return cachedBodyResponse({ ...corsHeaders, 'Cache-Control': 'public, max-age=3600, s-maxage=3600, stale-while-revalidate=600', 'X-Cache': 'REDIS-HIT' });
   }
 
   try {
@@ -176,33 +187,36 @@ export default async function handler(req) {
       }
     }
 
-    const sanitized = allEvents
-      .filter((event) => {
-        if (!Number.isFinite(latestDatasetMs)) return true;
-        const eventMs = parseDateMs(event?.date_start);
-        if (!Number.isFinite(eventMs)) return false;
-        return eventMs >= (latestDatasetMs - TRAILING_WINDOW_MS);
-      })
-      .map(e => ({
-        id: String(e.id || ''),
-        date_start: e.date_start || '',
-        date_end: e.date_end || '',
-        latitude: Number(e.latitude) || 0,
-        longitude: Number(e.longitude) || 0,
-        country: e.country || '',
-        side_a: (e.side_a || '').substring(0, 200),
-        side_b: (e.side_b || '').substring(0, 200),
-        deaths_best: Number(e.best) || 0,
-        deaths_low: Number(e.low) || 0,
-        deaths_high: Number(e.high) || 0,
-        type_of_violence: VIOLENCE_TYPE_MAP[e.type_of_violence] || 'state-based',
-        source_original: (e.source_original || '').substring(0, 300),
-      }))
-      .sort((a, b) => {
-        const bMs = parseDateMs(b.date_start);
-        const aMs = parseDateMs(a.date_start);
-        return (Number.isFinite(bMs) ? bMs : 0) - (Number.isFinite(aMs) ? aMs : 0);
+    // One pass per event: parse its date once, apply the trailing window and
+    // build the trimmed record; the sort then compares the precomputed keys
+    // instead of re-parsing both dates on every comparison.
+    const hasWindow = Number.isFinite(latestDatasetMs);
+    const cutoffMs = latestDatasetMs - TRAILING_WINDOW_MS;
+    const keyed = [];
+    for (const e of allEvents) {
+      const eventMs = parseDateMs(e?.date_start);
+      if (hasWindow && !(eventMs >= cutoffMs)) continue;
+      keyed.push({
+        sortMs: Number.isFinite(eventMs) ? eventMs : 0,
+        event: {
+          id: String(e.id || ''),
+          date_start: e.date_start || '',
+          date_end: e.date_end || '',
+          latitude: Number(e.latitude) || 0,
+          longitude: Number(e.longitude) || 0,
+          country: e.country || '',
+          side_a: (e.side_a || '').substring(0, 200),
+          side_b: (e.side_b || '').substring(0, 200),
+          deaths_best: Number(e.best) || 0,
+          deaths_low: Number(e.low) || 0,
+          deaths_high: Number(e.high) || 0,
+          type_of_violence: VIOLENCE_TYPE_MAP[e.type_of_violence] || 'state-based',
+          source_original: (e.source_original || '').substring(0, 300),
+        },
       });
+    }
+    keyed.sort((a, b) => b.sortMs - a.sortMs);
+    const sanitized = keyed.map(k => k.event);
 
     const result = {
       success: true,
@@ -212,21 +226,15 @@ export default async function handler(req) {
       cached_at: new Date().toISOString(),
     };
 
-    fallbackCache = { data: result, timestamp: now };
+    rememberResult(result, now);
     void setCachedJson(CACHE_KEY, result, CACHE_TTL_SECONDS);
     recordCacheTelemetry('/api/ucdp-events', 'MISS');
 
-    return Response.json(result, {
-      status: 200,
-      headers: { ...corsHeaders, 'Cache-Control': 'public, max-age=3600, s-maxage=3600, stale-while-revalidate=600', 'X-Cache': 'MISS' },
-    });
+    return cachedBodyResponse({ ...corsHeaders, 'Cache-Control': 'public, max-age=3600, s-maxage=3600, stale-while-revalidate=600', 'X-Cache': 'MISS' });
   } catch (error) {
     if (isValidResult(fallbackCache.data)) {
       recordCacheTelemetry('/api/ucdp-events', 'STALE');
-      return Response.json(fallbackCache.data, {
-        status: 200,
-        headers: { ...corsHeaders, 'Cache-Control': 'public, max-age=600, s-maxage=600, stale-while-revalidate=120', 'X-Cache': 'STALE' },
-      });
+      return cachedBodyResponse({ ...corsHeaders, 'Cache-Control': 'public, max-age=600, s-maxage=600, stale-while-revalidate=120', 'X-Cache': 'STALE' });
     }
 
     recordCacheTelemetry('/api/ucdp-events', 'ERROR');
@@ -1,12 +1,25 @@
 // YouTube Live Stream Detection API
 // Uses YouTube's oembed endpoint to check for live streams
+// Redis cached per channel (5 min TTL)
 
 import { getCorsHeaders, isDisallowedOrigin } from '../_cors.js';
+import { getCachedJson, setCachedJson } from '../_upstash-cache.js';
 
 export const config = {
   runtime: 'edge',
 };
 
+const CACHE_TTL_SECONDS = 300;
+const CACHE_VERSION = 'yt-live-v1';
+const CACHE_CONTROL = 'public, max-age=300, s-maxage=300, stale-while-revalidate=60';
+
+function liveResponse(payload) {
+  return new Response(JSON.stringify(payload), {
+    status: 200,
+    headers: { 'Content-Type': 'application/json', 'Cache-Control': CACHE_CONTROL },
+  });
+}
+
 export default async function handler(request) {
   const cors = getCorsHeaders(request);
   if (request.method === 'OPTIONS') return new Response(null, { status: 204, headers: cors });
@@ -23,9 +36,16 @@ export default async function handler(request) {
     });
   }
 
+  // Handles are case-insensitive; normalize so every spelling shares one entry
+  const channelHandle = channel.startsWith('@') ? channel : `@${channel}`;
+  const cacheKey = `${CACHE_VERSION}:${channelHandle.toLowerCase()}`;
+  const cached = await getCachedJson(cacheKey);
+  if (cached && typeof cached === 'object' && 'videoId' in cached) {
+    return liveResponse(cached);
+  }
+
   try {
     // Try to fetch the channel's live page
-    const channelHandle = channel.startsWith('@') ? channel : `@${channel}`;
     const liveUrl = `https://www.youtube.com/${channelHandle}/live`;
 
     const response = await fetch(liveUrl, {
@@ -48,24 +68,12 @@ export default async function handler(request) {
     const videoIdMatch = html.match(/"videoId":"([a-zA-Z0-9_-]{11})"/);
     const isLiveMatch = html.match(/"isLive":\s*true/);
 
-    if (videoIdMatch && isLiveMatch) {
-      return new Response(JSON.stringify({ videoId: videoIdMatch[1], isLive: true }), {
-        status: 200,
-        headers: {
-          'Content-Type': 'application/json',
-          'Cache-Control': 'public, max-age=300, s-maxage=300, stale-while-revalidate=60', // Cache for 5 minutes
-        },
-      });
-    }
-
-    // Return null if no live stream found
-    return new Response(JSON.stringify({ videoId: null, isLive: false }), {
-      status: 200,
-      headers: {
-        'Content-Type': 'application/json',
-        'Cache-Control': 'public, max-age=300, s-maxage=300, stale-while-revalidate=60',
-      },
-    });
+    // videoId is null when the channel is not currently live
+    const payload = videoIdMatch && isLiveMatch
+      ? { videoId: videoIdMatch[1], isLive: true }
+      : { videoId: null, isLive: false };
+    void setCachedJson(cacheKey, payload, CACHE_TTL_SECONDS);
+    return liveResponse(payload);
   } catch (error) {
     console.error('YouTube live check error:', error);
     return new Response(JSON.stringify({ videoId: null, error: error.message }), {
@@ -12,6 +12,8 @@
 
 import { WebSocketServer } from 'ws';
 import crypto from 'crypto';
+import { logger } from './logger.mjs';
+import { pruneExpired } from './rate-limit.mjs';
 
 // ============================================
 // Configuration
@@ -32,6 +34,9 @@ const RATE_LIMIT_MAX = 5; // max messages per window
 const VERIFICATION_CODE_EXPIRY = 10 * 60 * 1000; // 10 minutes
 const SESSION_EXPIRY = 24 * 60 * 60 * 1000; // 24 hours
 const MAX_USERNAME_LENGTH = 20;
+const MAX_USER_LIST = 200; // users sent per presence update; count stays exact
+const MAX_NEWS_HEADLINES = 30;
+const MAX_HEADLINE_LENGTH = 300;
 const PING_INTERVAL = 30000;
 
 // AI Bot configuration
@@ -125,9 +130,12 @@ function isValidUsername(username) {
 
 function checkRateLimit(sessionToken) {
   const now = Date.now();
-  const timestamps = rateLimits.get(sessionToken) || [];
-  const recent = timestamps.filter(t => now - t < RATE_LIMIT_WINDOW);
-  rateLimits.set(sessionToken, recent);
+  let recent = rateLimits.get(sessionToken);
+  if (!recent) {
+    recent = [];
+    rateLimits.set(sessionToken, recent);
+  }
+  pruneExpired(recent, now, RATE_LIMIT_WINDOW);
   if (recent.length >= RATE_LIMIT_MAX) return false;
   recent.push(now);
   return true;
@@ -135,9 +143,12 @@ function checkRateLimit(sessionToken) {
 
 function checkAiRateLimit(channelId) {
   const now = Date.now();
-  const timestamps = aiChannelRateLimits.get(channelId) || [];
-  const recent = timestamps.filter(t => now - t < AI_RATE_LIMIT_WINDOW);
-  aiChannelRateLimits.set(channelId, recent);
+  let recent = aiChannelRateLimits.get(channelId);
+  if (!recent) {
+    recent = [];
+    aiChannelRateLimits.set(channelId, recent);
+  }
+  pruneExpired(recent, now, AI_RATE_LIMIT_WINDOW);
   if (recent.length >= AI_RATE_LIMIT_MAX) return false;
   recent.push(now);
   return true;
@@ -180,17 +191,22 @@ function broadcastToChannel(channelId, message, excludeWs = null) {
   }
 }
 
-function broadcastUserList(channelId) {
+// Presence goes to every member on each join/leave, so cap the list to keep
+// the fan-out bounded in a busy channel; `count` is always the full total.
+function onlineUsersPayload(channelId) {
   const users = getOnlineUsers(channelId);
+  return { users: users.slice(0, MAX_USER_LIST), count: users.length };
+}
+
+function broadcastUserList(channelId) {
   broadcastToChannel(channelId, {
     type: 'users',
-    users,
-    count: users.length,
+    ...onlineUsersPayload(channelId),
   });
 }
 
 // Clean up expired sessions periodically
-setInterval(() => {
+const sessionCleanupTimer = setInterval(() => {
   const now = Date.now();
   for (const [token, session] of sessions) {
     if (now - session.createdAt > SESSION_EXPIRY) {
@@ -276,7 +292,7 @@ ${newsContext}`;
         if (reply) return reply;
       }
     } catch (err) {
-      console.error('[AI Bot] Groq error:', err.message);
+      logger.error('AI bot Groq request failed', { error: err.message });
     }
   }
 
@@ -306,7 +322,7 @@ ${newsContext}`;
         if (reply) return reply;
       }
     } catch (err) {
-      console.error('[AI Bot] OpenRouter error:', err.message);
+      logger.error('AI bot OpenRouter request failed', { error: err.message });
     }
   }
 
@@ -406,19 +422,15 @@ async function sendVerificationEmail(email, code) {
           </div>
         `,
       });
-      console.log(`[Chat] Verification email sent to ${email}`);
+      logger.info('Chat verification email sent', { email });
       return true;
     } catch (err) {
-      console.error(`[Chat] Failed to send email to ${email}:`, err.message);
+      logger.error('Chat verification email failed', { email, error: err.message });
       return false;
     }
   } else {
-    // Fallback: Log to console (development mode)
-    console.log(`\n╔══════════════════════════════════════════╗`);
-    console.log(`║  CHAT VERIFICATION CODE                   ║`);
-    console.log(`║  Email: ${email.padEnd(32)}║`);
-    console.log(`║  Code:  ${code}                            ║`);
-    console.log(`╚══════════════════════════════════════════╝\n`);
+    // Fallback: log the code (development mode, no SMTP configured)
+    logger.info('Chat verification code', { email, code });
     return true;
   }
 }
@@ -582,7 +594,7 @@ function handleJoinChannel(clientInfo, msg) {
     type: 'channel-joined',
     channel: channelId,
     messages: messages.slice(-50), // last 50
-    users: getOnlineUsers(channelId),
+    ...onlineUsersPayload(channelId),
   });
 
   // Broadcast updated user list
@@ -644,7 +656,7 @@ function handleSendMessage(clientInfo, msg) {
         postAiMessage(channelId, reply);
       }
     }).catch(err => {
-      console.error('[AI Bot] Error:', err.message);
+      logger.error('AI bot reply failed', { error: err.message });
     });
   }
 }
@@ -660,11 +672,24 @@ function handleTyping(clientInfo, msg) {
   }, clientInfo.ws);
 }
 
+// Replace the AI news context in one step: cap the count before touching any
+// entry, then keep only string headlines truncated to a bounded length.
+function storeNewsHeadlines(headlines) {
+  const stored = [];
+  for (const headline of headlines.slice(0, MAX_NEWS_HEADLINES)) {
+    if (typeof headline !== 'string') continue;
+    const text = headline.trim();
+    if (text) stored.push(text.slice(0, MAX_HEADLINE_LENGTH));
+  }
+  globalNewsCache = stored;
+  newsCacheTimestamp = Date.now();
+  return stored.length;
+}
+
 // Handle news update from frontend (for AI context)
 function handleUpdateNews(clientInfo, msg) {
   if (msg.headlines && Array.isArray(msg.headlines)) {
-    globalNewsCache = msg.headlines.slice(0, 30);
-    newsCacheTimestamp = Date.now();
+    storeNewsHeadlines(msg.headlines);
   }
 }
 
@@ -685,9 +710,11 @@ function send(ws, data) {
 export function setupChat(httpServer) {
   const wss = new WebSocketServer({ server: httpServer, path: '/ws/chat' });
 
-  console.log(`💬 Chat WebSocket ready at /ws/chat`);
-  console.log(`   Channels: ${CHANNELS.map(c => c.name).join(', ')}`);
-  console.log(`   AI Bot: ${AI_BOT.username} (mention @pulse to interact)`);
+  logger.info('Chat WebSocket ready', {
+    path: '/ws/chat',
+    channels: CHANNELS.map(c => c.name),
+    aiBot: AI_BOT.username,
+  });
 
   wss.on('connection', (ws, req) => {
     const clientInfo = {
@@ -721,7 +748,7 @@ export function setupChat(httpServer) {
       try {
         handleMessage(clientInfo, data.toString());
       } catch (err) {
-        console.error('[Chat] Message handler error:', err.message);
+        logger.error('Chat message handler error', { error: err.message });
       }
     });
 
@@ -739,7 +766,7 @@ export function setupChat(httpServer) {
   });
 
   // Ping/pong keep-alive
-  setInterval(() => {
+  const pingTimer = setInterval(() => {
     const now = Date.now();
     for (const client of connectedClients) {
       if (now - client.lastPong > PING_INTERVAL * 2) {
@@ -750,10 +777,20 @@ export function setupChat(httpServer) {
       send(client.ws, { type: 'ping' });
     }
   }, PING_INTERVAL);
+  wss.on('close', () => clearInterval(pingTimer));
 
   return wss;
 }
 
+// Stop timers and drop every open socket. wss.close() alone leaves existing
+// connections open when the server is shared with Express.
+export function closeChat(wss) {
+  clearInterval(sessionCleanupTimer);
+  for (const client of connectedClients) client.ws.terminate();
+  connectedClients.clear();
+  return new Promise((resolve) => wss.close(() => resolve()));
+}
+
 // REST API endpoints for chat
 export function setupChatRoutes(app) {
   // Get channel list and stats
@@ -789,22 +826,18 @@ export function setupChatRoutes(app) {
 
   // Update news headlines (called from system to give AI context)
   app.post('/api/chat/news', (req, res) => {
-    // Accept from local or trusted sources only
-    const chunks = [];
-    req.on('data', chunk => chunks.push(chunk));
-    req.on('end', () => {
-      try {
-        const body = JSON.parse(Buffer.concat(chunks).toString());
-        if (body.headlines && Array.isArray(body.headlines)) {
-          globalNewsCache = body.headlines.slice(0, 30);
-          newsCacheTimestamp = Date.now();
-          res.json({ ok: true, count: globalNewsCache.length });
-        } else {
-          res.status(400).json({ error: 'headlines array required' });
-        }
-      } catch {
-        res.status(400).json({ error: 'Invalid JSON' });
-      }
-    });
+    // Accept from local or trusted sources only.
+    // The /api body collector in index.mjs has already drained the stream.
+    let body;
+    try {
+      body = JSON.parse((req.rawBody || Buffer.alloc(0)).toString());
+    } catch {
+      return res.status(400).json({ error: 'Invalid JSON' });
+    }
+    if (body && Array.isArray(body.headlines)) {
+      res.json({ ok: true, count: storeNewsHeadlines(body.headlines) });
+    } else {
+      res.status(400).json({ error: 'headlines array required' });
+    }
   });
 }
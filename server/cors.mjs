@@ -0,0 +1,35 @@
+/**
+ * CORS for all /api and /rss routes — same allowlist as the edge handlers.
+ * Header values are fixed at startup and origin checks are memoized, so the
+ * per-request cost is a Map lookup plus a few setHeader calls.
+ */
+
+import { isAllowedOrigin } from '../api/_cors.js';
+
+const CORS_ALLOW_METHODS = 'GET, POST, OPTIONS';
+const CORS_ALLOW_HEADERS = 'Content-Type, Authorization';
+const CORS_MAX_AGE = '86400';
+const MAX_CORS_ORIGIN_CACHE = 256;
+const corsOriginCache = new Map();
+
+export function isCorsOriginAllowed(origin) {
+  let allowed = corsOriginCache.get(origin);
+  if (allowed === undefined) {
+    allowed = isAllowedOrigin(origin);
+    if (corsOriginCache.size >= MAX_CORS_ORIGIN_CACHE) corsOriginCache.clear();
+    corsOriginCache.set(origin, allowed);
+  }
+  return allowed;
+}
+
+export function applyCorsHeaders(req, res) {
+  const origin = req.headers.origin;
+  if (!origin) return;
+  res.setHeader('Vary', 'Origin');
+  if (isCorsOriginAllowed(origin)) {
+    res.setHeader('Access-Control-Allow-Origin', origin);
+    res.setHeader('Access-Control-Allow-Methods', CORS_ALLOW_METHODS);
+    res.setHeader('Access-Control-Allow-Headers', CORS_ALLOW_HEADERS);
+    res.setHeader('Access-Control-Max-Age', CORS_MAX_AGE);
+  }
+}
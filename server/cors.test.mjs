@@ -0,0 +1,35 @@
+import { strict as assert } from 'node:assert';
+import test from 'node:test';
+import { applyCorsHeaders, isCorsOriginAllowed } from './cors.mjs';
+
+function applyFor(origin) {
+  const headers = {};
+  const res = { setHeader: (key, value) => { headers[key] = value; } };
+  applyCorsHeaders({ headers: origin === null ? {} : { origin } }, res);
+  return headers;
+}
+
+test('allowlisted origins get the full CORS header set', () => {
+  for (const origin of ['https://tauri.localhost', 'http://127.0.0.1:46123']) {
+    assert.equal(isCorsOriginAllowed(origin), true);
+    assert.deepEqual(applyFor(origin), {
+      'Vary': 'Origin',
+      'Access-Control-Allow-Origin': origin,
+      'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+      'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+      'Access-Control-Max-Age': '86400',
+    });
+  }
+});
+
+test('unknown origins only get Vary, repeatedly', () => {
+  const origin = 'https://evil.example';
+  assert.deepEqual(applyFor(origin), { 'Vary': 'Origin' });
+  // Second lookup comes from the memo and must give the same answer.
+  assert.deepEqual(applyFor(origin), { 'Vary': 'Origin' });
+  assert.equal(isCorsOriginAllowed(origin), false);
+});
+
+test('requests without an Origin are left untouched', () => {
+  assert.deepEqual(applyFor(null), {});
+});
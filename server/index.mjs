@@ -4,19 +4,32 @@ import { createProxyMiddleware } from 'http-proxy-middleware';
 import { readFileSync, existsSync } from 'fs';
 import { resolve, dirname } from 'path';
 import { fileURLToPath } from 'url';
-import { createServer } from 'http';
-import { setupChat, setupChatRoutes } from './chat.mjs';
+import { createServer, STATUS_CODES } from 'http';
+import { constants as zlibConstants } from 'zlib';
+import { setupChat, setupChatRoutes, closeChat } from './chat.mjs';
+import { applyCorsHeaders } from './cors.mjs';
+import { createResponseCache, responseCacheKey, responseCacheTtlMs } from './response-cache.mjs';
+import { logger, flushLogs } from './logger.mjs';
 
 // ─── Global HTTP Proxy (for IPv6-only servers) ─────────────────
+// Upstream sockets are capped per origin and kept alive so API handlers reuse
+// a small warm pool instead of opening a fresh connection per request.
+const _poolOptions = {
+  connections: Math.max(1, Number(process.env.UPSTREAM_MAX_CONNECTIONS_PER_ORIGIN || 16)),
+  keepAliveTimeout: 30_000,
+  keepAliveMaxTimeout: 120_000,
+};
 const _proxyUrl = process.env.HTTPS_PROXY || process.env.HTTP_PROXY;
-if (_proxyUrl) {
-  try {
-    const { ProxyAgent, setGlobalDispatcher } = await import('undici');
-    setGlobalDispatcher(new ProxyAgent(_proxyUrl));
-    console.log(`[Proxy] Global HTTP proxy configured: ${_proxyUrl}`);
-  } catch (e) {
-    console.warn('[Proxy] Failed to configure proxy agent:', e.message);
+try {
+  const { Agent, ProxyAgent, setGlobalDispatcher } = await import('undici');
+  if (_proxyUrl) {
+    setGlobalDispatcher(new ProxyAgent({ uri: _proxyUrl, ..._poolOptions }));
+    logger.info('Global HTTP proxy configured', { proxy: _proxyUrl });
+  } else {
+    setGlobalDispatcher(new Agent(_poolOptions));
   }
+} catch (e) {
+  logger.warn('Failed to configure upstream agent', { error: e.message });
 }
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
@@ -24,18 +37,88 @@ const ROOT = resolve(__dirname, '..');
 const DIST = resolve(ROOT, 'dist');
 
 const app = express();
-const httpServer = createServer(app);
+// Health probes (Docker, load balancers) are answered before Express sees the
+// request: no middleware, router or error handling, just the cached body.
+const httpServer = createServer((req, res) => {
+  if (req.url === '/health' && (req.method === 'GET' || req.method === 'HEAD')) {
+    return sendRawJson(res, healthBody);
+  }
+  app(req, res);
+});
 const PORT = process.env.PORT || 3000;
+const VERSION = JSON.parse(readFileSync(resolve(ROOT, 'package.json'), 'utf8')).version;
+
+// ─── Cached clock ──────────────────────────────────────────────
+// Second-resolution ISO timestamp refreshed by a ticker, so frequently-hit
+// handlers (health probes) don't allocate and format a Date per request.
+// The ticker re-arms itself on the next wall-clock second, so the cached value
+// never lags the real second by more than timer jitter (a fixed 1s interval
+// drifts and could be almost a full second stale).
+function isoSeconds(ms) {
+  return new Date(ms).toISOString().slice(0, 19) + 'Z';
+}
+
+let nowIso = isoSeconds(Date.now());
 
-// Compression
-app.use(compression());
+// /health body: only the timestamp varies, so the rest is fixed at startup and
+// the full string is rebuilt once per tick rather than per probe.
+const HEALTH_PREFIX = `{"status":"healthy","service":"globalscope-server","version":${JSON.stringify(VERSION)},"timestamp":"`;
+const HEALTH_SUFFIX = '"}';
+let healthBody = HEALTH_PREFIX + nowIso + HEALTH_SUFFIX;
+
+function tickClock() {
+  const now = Date.now();
+  nowIso = isoSeconds(now);
+  healthBody = HEALTH_PREFIX + nowIso + HEALTH_SUFFIX;
+  setTimeout(tickClock, 1000 - (now % 1000)).unref();
+}
+setTimeout(tickClock, 1000 - (Date.now() % 1000)).unref();
+
+// ─── Raw JSON replies ──────────────────────────────────────────
+// Small fixed-shape bodies skip res.json()/res.send(): no settings lookups,
+// ETag hashing or freshness check — just headers and end().
+function sendRawJson(res, body) {
+  res.setHeader('Content-Type', 'application/json; charset=utf-8');
+  res.setHeader('Content-Length', Buffer.byteLength(body));
+  res.end(body);
+}
+
+// ─── JSON error responses ──────────────────────────────────────
+// Error messages are fixed literals, so each body is serialized and encoded to
+// bytes once, then written straight out (no res.json()/res.send() per failure —
+// this path is hit hardest by scanners probing for unknown URLs).
+const jsonErrorBodies = new Map();
+
+function sendJsonError(res, status, message) {
+  let body = jsonErrorBodies.get(message);
+  if (body === undefined) {
+    body = Buffer.from(JSON.stringify({ error: message }));
+    jsonErrorBodies.set(message, body);
+  }
+  res.statusCode = status;
+  sendRawJson(res, body);
+}
 
-// CORS for all /api and /rss routes
+// Preflights are answered first, before compression and routing, with an empty
+// 204 written straight to the socket.
 app.use((req, res, next) => {
-  res.header('Access-Control-Allow-Origin', '*');
-  res.header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS');
-  res.header('Access-Control-Allow-Headers', 'Content-Type, Authorization');
-  if (req.method === 'OPTIONS') return res.sendStatus(204);
+  if (req.method !== 'OPTIONS') return next();
+  applyCorsHeaders(req, res);
+  res.statusCode = 204;
+  res.end();
+});
+
+// Compression — gzip, or brotli when the client offers it (compression >= 1.8).
+// Bodies under 1 KB aren't worth the framing overhead; level 5 / quality 4 keep
+// CPU per response low on the large JSON and RSS payloads that dominate traffic.
+app.use(compression({
+  threshold: 1024,
+  level: 5,
+  brotli: { params: { [zlibConstants.BROTLI_PARAM_QUALITY]: 4 } },
+}));
+
+app.use((req, res, next) => {
+  applyCorsHeaders(req, res);
   next();
 });
 
@@ -93,6 +176,17 @@ const RSS_PROXIES = {
   '/rss/reuters': 'https://www.reutersagency.com',
 };
 
+// Let browsers and any CDN in front of us reuse successful upstream responses
+// (and serve them stale while revalidating) instead of re-fetching on every load.
+// Only for anonymous proxies: a request carrying credentials is never marked
+// public, so a shared cache can't hand one client's response to another.
+function cacheSuccessfulResponses(cacheControl) {
+  return (proxyRes, req) => {
+    if (proxyRes.statusCode !== 200 || req.headers.authorization) return;
+    proxyRes.headers['cache-control'] = cacheControl;
+  };
+}
+
 for (const [path, target] of Object.entries(RSS_PROXIES)) {
   app.use(path, createProxyMiddleware({
     target,
@@ -100,9 +194,10 @@ for (const [path, target] of Object.entries(RSS_PROXIES)) {
     pathRewrite: { [`^${path}`]: '' },
     timeout: 15000,
     on: {
+      proxyRes: cacheSuccessfulResponses('public, max-age=300, s-maxage=300, stale-while-revalidate=60'),
       error: (err, req, res) => {
-        console.error(`RSS proxy ${path} error:`, err.message);
-        if (!res.headersSent) res.status(502).json({ error: 'RSS proxy error' });
+        logger.error('RSS proxy error', { path, error: err.message });
+        if (!res.headersSent) sendJsonError(res, 502, 'RSS proxy error');
       },
     },
   }));
@@ -128,7 +223,10 @@ app.use('/api/pizzint', createProxyMiddleware({
   target: 'https://www.pizzint.watch',
   changeOrigin: true,
   pathRewrite: { '^/api/pizzint': '/api' },
-  on: { error: (err, req, res) => { if (!res.headersSent) res.status(502).json({ error: 'PizzINT proxy error' }); } },
+  on: {
+    proxyRes: cacheSuccessfulResponses('public, max-age=60, s-maxage=60, stale-while-revalidate=30'),
+    error: (err, req, res) => { if (!res.headersSent) sendJsonError(res, 502, 'PizzINT proxy error'); },
+  },
 }));
 
 // Cloudflare Radar
@@ -136,7 +234,9 @@ app.use('/api/cloudflare-radar', createProxyMiddleware({
   target: 'https://api.cloudflare.com',
   changeOrigin: true,
   pathRewrite: { '^/api/cloudflare-radar': '' },
-  on: { error: (err, req, res) => { if (!res.headersSent) res.status(502).json({ error: 'Cloudflare proxy error' }); } },
+  on: {
+    error: (err, req, res) => { if (!res.headersSent) sendJsonError(res, 502, 'Cloudflare proxy error'); },
+  },
 }));
 
 // NGA Maritime Safety
@@ -144,7 +244,10 @@ app.use('/api/nga-msi', createProxyMiddleware({
   target: 'https://msi.nga.mil',
   changeOrigin: true,
   pathRewrite: { '^/api/nga-msi': '' },
-  on: { error: (err, req, res) => { if (!res.headersSent) res.status(502).json({ error: 'NGA proxy error' }); } },
+  on: {
+    proxyRes: cacheSuccessfulResponses('public, max-age=3600, s-maxage=3600, stale-while-revalidate=600'),
+    error: (err, req, res) => { if (!res.headersSent) sendJsonError(res, 502, 'NGA proxy error'); },
+  },
 }));
 
 // Note: GDELT handled by Vercel edge handlers (gdelt-doc.js, gdelt-geo.js)
@@ -158,15 +261,15 @@ app.use('/api/adsb-exchange', createProxyMiddleware({
   target: 'https://adsbexchange.com/api',
   changeOrigin: true,
   pathRewrite: { '^/api/adsb-exchange': '' },
-  on: { error: (err, req, res) => { if (!res.headersSent) res.status(502).json({ error: 'ADS-B proxy error' }); } },
+  on: { error: (err, req, res) => { if (!res.headersSent) sendJsonError(res, 502, 'ADS-B proxy error'); } },
 }));
 
 // YouTube Live API
 app.get('/api/youtube/live', (req, res) => {
   const channel = req.query.channel;
-  if (!channel) return res.status(400).json({ error: 'Missing channel parameter' });
+  if (!channel) return sendJsonError(res, 400, 'Missing channel parameter');
   res.setHeader('Cache-Control', 'public, max-age=300');
-  res.json({ videoId: null, channel });
+  sendRawJson(res, JSON.stringify({ videoId: null, channel }));
 });
 
 // ============================================
@@ -175,14 +278,29 @@ app.get('/api/youtube/live', (req, res) => {
 // The API handlers use Vercel Edge Runtime format: export default function handler(req: Request) => Response
 // We adapt them to Express by wrapping the Request/Response
 
-async function loadVercelHandler(apiPath) {
+// Handlers are imported lazily on first use and the resulting promise is kept,
+// so later requests skip the filesystem probes and module resolution entirely.
+// A failed import is forgotten so the next request can retry it.
+const handlerCache = new Map();
+
+function loadVercelHandler(apiPath) {
+  let pending = handlerCache.get(apiPath);
+  if (!pending) {
+    pending = importVercelHandler(apiPath);
+    handlerCache.set(apiPath, pending);
+  }
+  return pending;
+}
+
+async function importVercelHandler(apiPath) {
   try {
     const modulePath = resolve(ROOT, 'api', apiPath);
     if (!existsSync(modulePath + '.js') && !existsSync(modulePath)) return null;
     const mod = await import(existsSync(modulePath + '.js') ? modulePath + '.js' : modulePath);
     return mod.default || null;
   } catch (err) {
-    console.error(`Failed to load API handler ${apiPath}:`, err.message);
+    logger.error('Failed to load API handler', { handler: apiPath, error: err.message });
+    handlerCache.delete(apiPath);
     return null;
   }
 }
@@ -201,12 +319,35 @@ app.use('/api', (req, res, next) => {
   }
 });
 
+// ─── Response cache ────────────────────────────────────────────
+// See response-cache.mjs; entries live for the response's own max-age, capped.
+const RESPONSE_CACHE_MAX_ENTRIES = 500;
+const RESPONSE_CACHE_MAX_TTL_MS = 60_000;
+// Feed proxy responses are identical for every client and polled on a 5-minute
+// cycle, so they keep their full max-age: a feed is pulled from its origin at
+// most once per window however many dashboards are open.
+const FEED_RESPONSE_CACHE_MAX_TTL_MS = 300_000;
+const responseCache = createResponseCache(RESPONSE_CACHE_MAX_ENTRIES);
+
+function sendCachedResponse(res, entry) {
+  res.status(entry.status);
+  for (const [key, value] of entry.headers) res.setHeader(key, value);
+  res.send(entry.body);
+}
+
 // Adapt Vercel Edge handler to Express
 function vercelEdgeAdapter(handlerPath) {
-  return async (req, res) => {
+  const maxCacheTtlMs = handlerPath === 'rss-proxy' ? FEED_RESPONSE_CACHE_MAX_TTL_MS : RESPONSE_CACHE_MAX_TTL_MS;
+  return async (req, res, next) => {
     try {
+      const cacheKey = responseCacheKey(req);
+      if (cacheKey) {
+        const cached = responseCache.get(cacheKey);
+        if (cached) return sendCachedResponse(res, cached);
+      }
+
       const handler = await loadVercelHandler(handlerPath);
-      if (!handler) return res.status(404).json({ error: 'API handler not found' });
+      if (!handler) return sendJsonError(res, 404, 'API handler not found');
 
       // Build a Web API Request from Express req
       const url = new URL(req.originalUrl, `http://${req.headers.host || 'localhost'}`);
@@ -224,17 +365,24 @@ function vercelEdgeAdapter(handlerPath) {
       const webResponse = await handler(webRequest);
 
       // Copy status and headers
+      const headers = [];
       res.status(webResponse.status);
       webResponse.headers.forEach((value, key) => {
         res.setHeader(key, value);
+        headers.push([key, value]);
       });
 
       // Send body
       const body = await webResponse.text();
       res.send(body);
+
+      const ttlMs = cacheKey && webResponse.status === 200
+        ? responseCacheTtlMs(webResponse.headers.get('cache-control'), maxCacheTtlMs)
+        : 0;
+      if (ttlMs > 0) responseCache.set(cacheKey, ttlMs, { status: 200, headers, body });
     } catch (err) {
-      console.error(`API error ${handlerPath}:`, err.message);
-      if (!res.headersSent) res.status(500).json({ error: 'Internal server error' });
+      // Express 4 doesn't see async rejections; hand them to the error middleware.
+      next(err);
     }
   };
 }
@@ -327,23 +475,106 @@ app.use(express.static(DIST, {
   },
 }));
 
-// SPA fallback - serve index.html for all non-API routes
+// SPA fallback - serve index.html for all non-API routes.
+// The shell only changes on redeploy (which restarts the server), so it is read
+// once and served from memory instead of stat+open+stream on every navigation.
+const INDEX_HTML_PATH = resolve(DIST, 'index.html');
+let indexHtml = null;
+
 app.get('*', (req, res) => {
   if (req.url.startsWith('/api/') || req.url.startsWith('/rss/')) {
-    return res.status(404).json({ error: 'Not found' });
+    return sendJsonError(res, 404, 'Not found');
   }
-  res.sendFile(resolve(DIST, 'index.html'));
+  if (indexHtml === null && existsSync(INDEX_HTML_PATH)) indexHtml = readFileSync(INDEX_HTML_PATH);
+  if (indexHtml === null) return res.sendFile(INDEX_HTML_PATH);
+  res.setHeader('Cache-Control', 'no-cache, no-store, must-revalidate');
+  res.type('html').send(indexHtml);
+});
+
+// Anything still unmatched (non-GET to unknown paths) and any error passed to
+// next(err) — static-file failures, malformed URIs, handler errors — ends up in
+// one place and is answered by status code from the cached JSON bodies,
+// instead of Express's default HTML error page.
+app.use((req, res) => {
+  sendJsonError(res, 404, 'Not found');
+});
+
+app.use((err, req, res, next) => {
+  const status = err.status || err.statusCode || 500;
+  // originalUrl is the raw request-line string; req.path would run it through
+  // the URL parser just to build a log field.
+  if (status >= 500) logger.error('Unhandled request error', { url: req.originalUrl, error: err.message });
+  if (res.headersSent) return next(err);
+  sendJsonError(res, status, status >= 500 ? 'Internal server error' : (STATUS_CODES[status] || 'Bad request'));
 });
 
 // ============================================
 // Chat System (WebSocket)
 // ============================================
-setupChat(httpServer);
+const chatServer = setupChat(httpServer);
+
+// ============================================
+// Shutdown
+// ============================================
+// Each subsystem registers its own teardown. On SIGTERM/SIGINT all of them run
+// concurrently, each guarded on its own and bounded by a deadline, so one slow
+// or failing step neither skips another's cleanup nor stretches shutdown past
+// the orchestrator's grace period.
+const SHUTDOWN_STEP_TIMEOUT_MS = 5000;
+const shutdownHooks = [];
+
+function onShutdown(name, fn) {
+  shutdownHooks.push({ name, fn });
+}
+
+function runShutdownStep({ name, fn }) {
+  let timer;
+  const deadline = new Promise((_, reject) => {
+    timer = setTimeout(() => reject(new Error(`timed out after ${SHUTDOWN_STEP_TIMEOUT_MS}ms`)), SHUTDOWN_STEP_TIMEOUT_MS);
+  });
+  return Promise.race([Promise.resolve().then(fn), deadline])
+    .catch((err) => logger.error('Shutdown step failed', { step: name, error: err.message }))
+    .finally(() => clearTimeout(timer));
+}
+
+let shuttingDown = false;
+async function shutdown(signal) {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  logger.info('Shutting down', { signal });
+  await Promise.all(shutdownHooks.map(runShutdownStep));
+  flushLogs();
+  process.exit(0);
+}
+
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));
+
+onShutdown('http', () => new Promise((resolve) => {
+  httpServer.close(() => resolve());
+  httpServer.closeIdleConnections();
+}));
+onShutdown('chat', () => closeChat(chatServer));
+
+// Keep idle client sockets open longer than nginx's upstream keepalive_timeout
+// (60s), so the proxy always closes a pooled connection first and never reuses
+// one Node has just torn down (which surfaces as a sporadic 502).
+httpServer.keepAliveTimeout = 65_000;
+httpServer.headersTimeout = 66_000;
 
 // Start server (use httpServer for WebSocket support)
 httpServer.listen(PORT, '0.0.0.0', () => {
-  console.log(`🌍 GlobalScope server running on port ${PORT}`);
-  console.log(`   Frontend: http://0.0.0.0:${PORT}`);
-  console.log(`   API proxies: ${Object.keys(RSS_PROXIES).length} RSS + ${VERCEL_APIS.length} API handlers`);
-  console.log(`   Chat WebSocket: ws://0.0.0.0:${PORT}/ws/chat`);
+  logger.info('GlobalScope server running', {
+    port: PORT,
+    frontend: `http://0.0.0.0:${PORT}`,
+    rssProxies: Object.keys(RSS_PROXIES).length,
+    apiHandlers: VERCEL_APIS.length,
+    chat: `ws://0.0.0.0:${PORT}/ws/chat`,
+  });
+
+  // Warm the handler cache concurrently in the background so the first real
+  // request to each endpoint doesn't pay the module load.
+  Promise.all(VERCEL_APIS.map(loadVercelHandler)).then((handlers) => {
+    logger.info('API handlers loaded', { loaded: handlers.filter(Boolean).length, total: VERCEL_APIS.length });
+  });
 });
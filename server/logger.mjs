@@ -0,0 +1,56 @@
+/**
+ * GlobalScope — Server logger
+ *
+ * Leveled, structured logger for the Express server:
+ * - One JSON object per line (time, level, msg, extra fields)
+ * - LOG_LEVEL (debug | info | warn | error) picks the threshold once at startup;
+ *   disabled levels are bound to a no-op so they cost nothing to call
+ * - Callers pass fields as an object instead of building message strings
+ * - Lines are queued and written in one batch per event-loop turn, so a request
+ *   handler that logs never waits on a stdout/stderr write; the queue is also
+ *   flushed synchronously on exit and on a crash so the last lines survive
+ */
+
+const LEVELS = { debug: 10, info: 20, warn: 30, error: 40 };
+const threshold = LEVELS[(process.env.LOG_LEVEL || 'info').toLowerCase()] ?? LEVELS.info;
+
+const pending = new Map([[process.stdout, []], [process.stderr, []]]);
+let flushScheduled = false;
+
+export function flushLogs() {
+  flushScheduled = false;
+  for (const [stream, lines] of pending) {
+    if (lines.length === 0) continue;
+    stream.write(lines.join(''));
+    lines.length = 0;
+  }
+}
+
+function noop() {}
+
+function writer(level, stream) {
+  if (LEVELS[level] < threshold) return noop;
+  const lines = pending.get(stream);
+  return (msg, fields) => {
+    lines.push(JSON.stringify({ ...fields, time: Date.now(), level, msg }) + '\n');
+    if (!flushScheduled) {
+      flushScheduled = true;
+      setImmediate(flushLogs);
+    }
+  };
+}
+
+export const logger = {
+  debug: writer('debug', process.stdout),
+  info: writer('info', process.stdout),
+  warn: writer('warn', process.stderr),
+  error: writer('error', process.stderr),
+};
+
+// The monitor runs before Node's default crash handling without replacing it,
+// so the process still dies with the usual trace after the queue is written.
+process.on('uncaughtExceptionMonitor', (err, origin) => {
+  logger.error('Uncaught exception', { origin, error: err?.message, stack: err?.stack });
+  flushLogs();
+});
+process.on('exit', flushLogs);
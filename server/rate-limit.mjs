@@ -0,0 +1,12 @@
+/**
+ * Sliding-window helpers for the chat rate limits.
+ */
+
+// Timestamps are appended in order, so expired entries are always a prefix.
+// The prefix is spliced off in place; unexpired entries are left untouched.
+export function pruneExpired(timestamps, now, windowMs) {
+  let expired = 0;
+  while (expired < timestamps.length && now - timestamps[expired] >= windowMs) expired++;
+  if (expired > 0) timestamps.splice(0, expired);
+  return timestamps;
+}
@@ -0,0 +1,30 @@
+import { strict as assert } from 'node:assert';
+import test from 'node:test';
+import { pruneExpired } from './rate-limit.mjs';
+
+test('splices off the expired prefix in place and keeps unexpired timestamps', () => {
+  const timestamps = [1_000, 2_000, 3_000, 9_500, 10_000];
+  const result = pruneExpired(timestamps, 12_000, 5_000);
+
+  assert.equal(result, timestamps);
+  assert.deepEqual(timestamps, [9_500, 10_000]);
+});
+
+test('a timestamp exactly one window old is expired', () => {
+  const timestamps = [7_000, 7_001];
+  pruneExpired(timestamps, 12_000, 5_000);
+  assert.deepEqual(timestamps, [7_001]);
+});
+
+test('leaves the list alone when nothing has expired', () => {
+  const timestamps = [11_000, 11_500];
+  pruneExpired(timestamps, 12_000, 5_000);
+  assert.deepEqual(timestamps, [11_000, 11_500]);
+});
+
+test('empties the list when every timestamp has expired', () => {
+  const timestamps = [1_000, 2_000];
+  pruneExpired(timestamps, 60_000, 5_000);
+  assert.deepEqual(timestamps, []);
+  assert.deepEqual(pruneExpired([], 60_000, 5_000), []);
+});
@@ -0,0 +1,40 @@
+/**
+ * In-memory response cache for the Vercel handler adapter.
+ *
+ * Most handlers serve aggregated data that only changes every few minutes and
+ * already mark it publicly cacheable. Identical GETs are answered from memory
+ * for the response's own s-maxage/max-age (capped), so bursts of dashboard
+ * loads don't each re-run the handler and its upstream/Redis lookups.
+ */
+
+export function responseCacheTtlMs(cacheControl, maxTtlMs) {
+  if (!cacheControl || /no-store|no-cache|private/.test(cacheControl)) return 0;
+  const match = /s-maxage=(\d+)/.exec(cacheControl) || /max-age=(\d+)/.exec(cacheControl);
+  return match ? Math.min(Number(match[1]) * 1000, maxTtlMs) : 0;
+}
+
+// The key includes Origin and Accept because handlers vary CORS headers and
+// some (service-status) the body format on them. Authorized requests are never
+// shared between clients.
+export function responseCacheKey(req) {
+  if (req.method !== 'GET' || req.headers.authorization) return null;
+  return `${req.headers.origin || ''}\n${req.headers.accept || ''}\n${req.originalUrl}`;
+}
+
+// Insertion-ordered Map: once full, the oldest entry is evicted first.
+export function createResponseCache(maxEntries) {
+  const entries = new Map();
+  return {
+    get(key) {
+      const entry = entries.get(key);
+      return entry && entry.expiresAt > Date.now() ? entry : undefined;
+    },
+    set(key, ttlMs, entry) {
+      if (entries.size >= maxEntries) entries.delete(entries.keys().next().value);
+      entries.set(key, { ...entry, expiresAt: Date.now() + ttlMs });
+    },
+    get size() {
+      return entries.size;
+    },
+  };
+}
@@ -0,0 +1,53 @@
+import { strict as assert } from 'node:assert';
+import test from 'node:test';
+import { createResponseCache, responseCacheKey, responseCacheTtlMs } from './response-cache.mjs';
+
+function makeReq({ method = 'GET', url = '/api/service-status', headers = {} } = {}) {
+  return { method, originalUrl: url, headers };
+}
+
+test('TTL follows s-maxage over max-age and is capped', () => {
+  assert.equal(responseCacheTtlMs('public, max-age=30, s-maxage=120', 300_000), 120_000);
+  assert.equal(responseCacheTtlMs('public, max-age=30', 300_000), 30_000);
+  assert.equal(responseCacheTtlMs('public, s-maxage=600', 60_000), 60_000);
+});
+
+test('TTL is zero for uncacheable responses', () => {
+  for (const cacheControl of [null, '', 'no-store', 'private, max-age=60', 'no-cache, max-age=60', 'public']) {
+    assert.equal(responseCacheTtlMs(cacheControl, 60_000), 0, `should not cache: ${cacheControl}`);
+  }
+});
+
+test('key separates Origin and Accept and skips non-GET or authorized requests', () => {
+  const plain = responseCacheKey(makeReq());
+  const ndjson = responseCacheKey(makeReq({ headers: { accept: 'application/x-ndjson' } }));
+  const withOrigin = responseCacheKey(makeReq({ headers: { origin: 'https://globalpulse.app' } }));
+  assert.equal(new Set([plain, ndjson, withOrigin]).size, 3);
+
+  assert.equal(responseCacheKey(makeReq({ method: 'POST' })), null);
+  assert.equal(responseCacheKey(makeReq({ headers: { authorization: 'Bearer token' } })), null);
+});
+
+test('entries expire after their TTL', (t) => {
+  let now = 1_000_000;
+  t.mock.method(Date, 'now', () => now);
+  const cache = createResponseCache(10);
+
+  cache.set('a', 5_000, { status: 200, headers: [], body: 'one' });
+  now += 4_999;
+  assert.equal(cache.get('a')?.body, 'one');
+  now += 1;
+  assert.equal(cache.get('a'), undefined);
+});
+
+test('the oldest entry is evicted once the cache is full', () => {
+  const cache = createResponseCache(2);
+  cache.set('a', 60_000, { body: 'a' });
+  cache.set('b', 60_000, { body: 'b' });
+  cache.set('c', 60_000, { body: 'c' });
+
+  assert.equal(cache.size, 2);
+  assert.equal(cache.get('a'), undefined);
+  assert.equal(cache.get('b')?.body, 'b');
+  assert.equal(cache.get('c')?.body, 'c');
+});
@@ -173,29 +173,44 @@ fn read_cache_entry(app: AppHandle, key: String) -> Result<Option<Value>, String
     Ok(root.get(&key).cloned())
 }
 
+fn load_cache_store(path: &Path) -> Result<Map<String, Value>, String> {
+    if !path.exists() {
+        return Ok(Map::new());
+    }
+    let contents = std::fs::read_to_string(path)
+        .map_err(|e| format!("Failed to read cache store {}: {e}", path.display()))?;
+    Ok(serde_json::from_str::<Value>(&contents)
+        .ok()
+        .and_then(|v| v.as_object().cloned())
+        .unwrap_or_default())
+}
+
+fn save_cache_store(path: &Path, root: Map<String, Value>) -> Result<(), String> {
+    let serialized = serde_json::to_string_pretty(&Value::Object(root))
+        .map_err(|e| format!("Failed to serialize cache store: {e}"))?;
+    std::fs::write(path, serialized)
+        .map_err(|e| format!("Failed to write cache store {}: {e}", path.display()))
+}
+
 #[tauri::command]
 fn write_cache_entry(app: AppHandle, key: String, value: String) -> Result<(), String> {
-    let path = cache_file_path(&app)?;
+    write_cache_entries(app, vec![(key, value)])
+}
 
-    let mut root: Map<String, Value> = if path.exists() {
-        let contents = std::fs::read_to_string(&path)
-            .map_err(|e| format!("Failed to read cache store {}: {e}", path.display()))?;
-        serde_json::from_str::<Value>(&contents)
-            .ok()
-            .and_then(|v| v.as_object().cloned())
-            .unwrap_or_default()
-    } else {
-        Map::new()
-    };
+/// Apply several cache writes with a single read-modify-write of the store
+/// file, instead of rewriting the whole file once per entry.
+#[tauri::command]
+fn write_cache_entries(app: AppHandle, entries: Vec<(String, String)>) -> Result<(), String> {
+    let path = cache_file_path(&app)?;
+    let mut root = load_cache_store(&path)?;
 
-    let parsed_value: Value = serde_json::from_str(&value)
-        .map_err(|e| format!("Invalid cache payload JSON: {e}"))?;
-    root.insert(key, parsed_value);
+    for (key, value) in entries {
+        let parsed_value: Value = serde_json::from_str(&value)
+            .map_err(|e| format!("Invalid cache payload JSON: {e}"))?;
+        root.insert(key, parsed_value);
+    }
 
-    let serialized = serde_json::to_string_pretty(&Value::Object(root))
-        .map_err(|e| format!("Failed to serialize cache store: {e}"))?;
-    std::fs::write(&path, serialized)
-        .map_err(|e| format!("Failed to write cache store {}: {e}", path.display()))
+    save_cache_store(&path, root)
 }
 
 fn logs_dir_path(app: &AppHandle) -> Result<PathBuf, String> {
@@ -704,6 +719,7 @@ fn main() {
             get_desktop_runtime_info,
             read_cache_entry,
             write_cache_entry,
+            write_cache_entries,
             open_logs_folder,
             open_sidecar_log_file,
             open_settings_window_command,
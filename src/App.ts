@@ -1,6 +1,8 @@
 import type { NewsItem, Monitor, PanelConfig, MapLayers, RelatedAsset, InternetOutage, SocialUnrestEvent, MilitaryFlight, MilitaryVessel, MilitaryFlightCluster, MilitaryVesselCluster, CyberThreat } from '@/types';
 import {
   FEEDS,
+  FEED_CATEGORIES,
+  ALL_FEED_SOURCE_NAMES,
   INTEL_SOURCES,
   SECTORS,
   COMMODITIES,
@@ -137,6 +139,14 @@ const DESKTOP_BUILD_VARIANT: DesktopBuildVariant = (
     : 'full'
 );
 
+// Upper bound on how long a due refresh waits for the main thread to go idle.
+const REFRESH_IDLE_TIMEOUT_MS = 2000;
+
+function waitForIdle(timeoutMs: number): Promise<void> {
+  if (typeof requestIdleCallback !== 'function') return Promise.resolve();
+  return new Promise((resolve) => requestIdleCallback(() => resolve(), { timeout: timeoutMs }));
+}
+
 export interface CountryBriefSignals {
   protests: number;
   militaryFlights: number;
@@ -186,6 +196,7 @@ export class App {
   private seenGeoAlerts: Set<string> = new Set();
   private snapshotIntervalId: ReturnType<typeof setInterval> | null = null;
   private refreshTimeoutIds: Map<string, ReturnType<typeof setTimeout>> = new Map();
+  private parkedRefreshes: Map<string, () => void> = new Map();
   private isDestroyed = false;
   private boundKeydownHandler: ((e: KeyboardEvent) => void) | null = null;
   private boundFullscreenHandler: (() => void) | null = null;
@@ -2022,6 +2033,7 @@ export class App {
       clearTimeout(timeoutId);
     }
     this.refreshTimeoutIds.clear();
+    this.parkedRefreshes.clear();
 
     // Remove global event listeners
     if (this.boundKeydownHandler) {
@@ -2798,6 +2810,7 @@ export class App {
         mlWorker.unloadOptionalModels();
       } else {
         this.resetIdleTimer();
+        this.resumeParkedRefreshes();
       }
     };
     document.addEventListener('visibilitychange', this.boundVisibilityHandler);
@@ -3062,18 +3075,9 @@ export class App {
     return localized === lookup ? fallback : localized;
   }
 
-  private getAllSourceNames(): string[] {
-    const sources = new Set<string>();
-    Object.values(FEEDS).forEach(feeds => {
-      if (feeds) feeds.forEach(f => sources.add(f.name));
-    });
-    INTEL_SOURCES.forEach(f => sources.add(f.name));
-    return Array.from(sources).sort((a, b) => a.localeCompare(b));
-  }
-
   private renderSourceToggles(filter = ''): void {
     const container = document.getElementById('sourceToggles')!;
-    const allSources = this.getAllSourceNames();
+    const allSources = ALL_FEED_SOURCE_NAMES;
     const filterLower = filter.toLowerCase();
     const filteredSources = filter
       ? allSources.filter(s => s.toLowerCase().includes(filterLower))
@@ -3143,9 +3147,8 @@ export class App {
     });
 
     document.getElementById('sourcesSelectNone')?.addEventListener('click', () => {
-      const allSources = this.getAllSourceNames();
-      this.disabledSources = new Set(allSources);
-      saveToStorage(STORAGE_KEYS.disabledFeeds, allSources);
+      this.disabledSources = new Set(ALL_FEED_SOURCE_NAMES);
+      saveToStorage(STORAGE_KEYS.disabledFeeds, ALL_FEED_SOURCE_NAMES);
       const filter = (document.getElementById('sourcesSearch') as HTMLInputElement)?.value || '';
       this.renderSourceToggles(filter);
     });
@@ -3501,42 +3504,50 @@ export class App {
 
   private async loadNews(): Promise<void> {
     // Build categories dynamically from whatever feeds the current variant exports
-    const categories = Object.entries(FEEDS)
-      .filter((entry): entry is [string, typeof FEEDS[keyof typeof FEEDS]] => Array.isArray(entry[1]) && entry[1].length > 0)
-      .map(([key, feeds]) => ({ key, feeds }));
+    const categories = FEED_CATEGORIES;
 
     // Stage category fetches to avoid startup bursts and API pressure in all variants.
     const maxCategoryConcurrency = SITE_VARIANT === 'finance' ? 3 : SITE_VARIANT === 'tech' ? 4 : 5;
     const categoryConcurrency = Math.max(1, Math.min(maxCategoryConcurrency, categories.length));
-    const categoryResults: PromiseSettledResult<NewsItem[]>[] = [];
-    for (let i = 0; i < categories.length; i += categoryConcurrency) {
-      const chunk = categories.slice(i, i + categoryConcurrency);
-      const chunkResults = await Promise.allSettled(
-        chunk.map(({ key, feeds }) => this.loadNewsCategory(key, feeds))
-      );
-      categoryResults.push(...chunkResults);
-    }
-
-    // Collect successful results
-    const collectedNews: NewsItem[] = [];
-    categoryResults.forEach((result, idx) => {
-      if (result.status === 'fulfilled') {
-        collectedNews.push(...result.value);
-      } else {
-        console.error(`[App] News category ${categories[idx]?.key} failed:`, result.reason);
+    // Intel feeds run alongside the category pool rather than after it. The
+    // fetch is settled at creation so a rejection while the pool is still
+    // running isn't reported as an unhandled rejection.
+    const enabledIntelSources = SITE_VARIANT === 'full'
+      ? INTEL_SOURCES.filter(f => !this.disabledSources.has(f.name))
+      : [];
+    const intelFetch = enabledIntelSources.length > 0
+      ? Promise.allSettled([fetchCategoryFeeds(enabledIntelSources)])
+      : null;
+
+    // A fixed pool keeps that many categories in flight; each panel renders as
+    // its own category finishes instead of waiting on the slowest of a chunk.
+    const categoryResults: NewsItem[][] = new Array(categories.length);
+    let nextCategory = 0;
+    const categoryWorker = async () => {
+      while (nextCategory < categories.length) {
+        const idx = nextCategory++;
+        const { key, feeds } = categories[idx]!;
+        try {
+          categoryResults[idx] = await this.loadNewsCategory(key, feeds);
+        } catch (error) {
+          console.error(`[App] News category ${key} failed:`, error);
+        }
       }
-    });
+    };
+    await Promise.all(Array.from({ length: categoryConcurrency }, categoryWorker));
+
+    // Collect successful results (failed categories leave a hole)
+    const collectedNews: NewsItem[] = categoryResults.flat();
 
     // Intel (uses different source) - full variant only (defense/military news)
     if (SITE_VARIANT === 'full') {
-      const enabledIntelSources = INTEL_SOURCES.filter(f => !this.disabledSources.has(f.name));
       const intelPanel = this.newsPanels['intel'];
-      if (enabledIntelSources.length === 0) {
+      if (!intelFetch) {
         delete this.newsByCategory['intel'];
         if (intelPanel) intelPanel.showError(t('common.allIntelSourcesDisabled'));
         this.statusPanel?.updateFeed('Intel', { status: 'ok', itemCount: 0 });
       } else {
-        const intelResult = await Promise.allSettled([fetchCategoryFeeds(enabledIntelSources)]);
+        const intelResult = await intelFetch;
         if (intelResult[0]?.status === 'fulfilled') {
           const intel = intelResult[0].value;
           this.renderNewsForCategory('intel', intel);
@@ -4564,13 +4575,13 @@ export class App {
     intervalMs: number,
     condition?: () => boolean
   ): void {
-    const HIDDEN_REFRESH_MULTIPLIER = 4;
     const JITTER_FRACTION = 0.1;
     const MIN_REFRESH_MS = 1000;
-    const computeDelay = (baseMs: number, isHidden: boolean) => {
-      const adjusted = baseMs * (isHidden ? HIDDEN_REFRESH_MULTIPLIER : 1);
-      const jitterRange = adjusted * JITTER_FRACTION;
-      const jittered = adjusted + (Math.random() * 2 - 1) * jitterRange;
+    // Parked jobs restart spread over this window so returning to the tab is not one burst
+    const RESUME_SPREAD_MS = 5000;
+    const computeDelay = (baseMs: number) => {
+      const jitterRange = baseMs * JITTER_FRACTION;
+      const jittered = baseMs + (Math.random() * 2 - 1) * jitterRange;
       return Math.max(MIN_REFRESH_MS, Math.round(jittered));
     };
     const scheduleNext = (delay: number) => {
@@ -4580,30 +4591,41 @@ export class App {
     };
     const run = async () => {
       if (this.isDestroyed) return;
-      const isHidden = document.visibilityState === 'hidden';
-      if (isHidden) {
-        scheduleNext(computeDelay(intervalMs, true));
+      // A hidden tab never refreshes, so rather than waking up just to re-arm,
+      // park the job; the visibility handler restarts every parked job at once.
+      if (document.visibilityState === 'hidden') {
+        this.parkedRefreshes.set(name, () => scheduleNext(Math.round(Math.random() * RESUME_SPREAD_MS)));
         return;
       }
       if (condition && !condition()) {
-        scheduleNext(computeDelay(intervalMs, false));
+        scheduleNext(computeDelay(intervalMs));
         return;
       }
       if (this.inFlight.has(name)) {
-        scheduleNext(computeDelay(intervalMs, false));
+        scheduleNext(computeDelay(intervalMs));
         return;
       }
       this.inFlight.add(name);
       try {
+        // Refresh jobs parse and classify on the UI thread; start them in an
+        // idle period so a burst of timers doesn't land mid-interaction.
+        await waitForIdle(REFRESH_IDLE_TIMEOUT_MS);
+        if (this.isDestroyed) return;
         await fn();
       } catch (e) {
         console.error(`[App] Refresh ${name} failed:`, e);
       } finally {
         this.inFlight.delete(name);
-        scheduleNext(computeDelay(intervalMs, false));
+        scheduleNext(computeDelay(intervalMs));
       }
     };
-    scheduleNext(computeDelay(intervalMs, document.visibilityState === 'hidden'));
+    scheduleNext(computeDelay(intervalMs));
+  }
+
+  private resumeParkedRefreshes(): void {
+    const parked = Array.from(this.parkedRefreshes.values());
+    this.parkedRefreshes.clear();
+    for (const resume of parked) resume();
   }
 
   private setupRefreshIntervals(): void {
@@ -30,6 +30,7 @@ interface ChatState {
   pendingEmail: string;
   error: string;
   typingUsers: Map<string, number>;
+  channelOnline: number;
   totalOnline: number;
   isConnected: boolean;
   aiBot: AiBotInfo | null;
@@ -58,6 +59,7 @@ export class GlobalChat {
       pendingEmail: '',
       error: '',
       typingUsers: new Map(),
+      channelOnline: 0,
       totalOnline: 0,
       isConnected: false,
       aiBot: null,
@@ -122,10 +124,11 @@ export class GlobalChat {
         this.render();
       }),
       chatService.on('channel-joined', (data: unknown) => {
-        const d = data as { channel: string; messages: ChatMessage[]; users: ChatUser[] };
+        const d = data as { channel: string; messages: ChatMessage[]; users: ChatUser[]; count: number };
         this.state.activeChannel = d.channel;
         this.state.messages = d.messages;
         this.state.users = d.users;
+        this.state.channelOnline = d.count;
         this.state.typingUsers.clear();
         this.render();
         this.scrollToBottom();
@@ -144,6 +147,7 @@ export class GlobalChat {
       chatService.on('users', (data: unknown) => {
         const d = data as { users: ChatUser[]; count: number };
         this.state.users = d.users;
+        this.state.channelOnline = d.count;
         this.state.totalOnline = d.count;
         this.renderUserCount();
       }),
@@ -353,7 +357,7 @@ export class GlobalChat {
           <div class="gc-header-left">
             <span class="gc-header-icon">${channel?.icon || '💬'}</span>
             <span class="gc-header-title">${channel?.name || 'Chat'}</span>
-            <span class="gc-online-badge" id="gcOnlineCount">${this.state.users.length} online</span>
+            <span class="gc-online-badge" id="gcOnlineCount">${this.state.channelOnline} online</span>
           </div>
           <div class="gc-header-right">
             <button class="gc-header-btn" id="gcChannelToggle" title="Channels">☰</button>
@@ -478,7 +482,7 @@ export class GlobalChat {
 
   private renderUserCount(): void {
     const el = this.container.querySelector('#gcOnlineCount');
-    if (el) el.textContent = `${this.state.users.length} online`;
+    if (el) el.textContent = `${this.state.channelOnline} online`;
   }
 
   private renderTypingIndicator(): void {
@@ -562,6 +566,7 @@ export class GlobalChat {
       this.state.userColor = '';
       this.state.messages = [];
       this.state.users = [];
+      this.state.channelOnline = 0;
       this.state.error = '';
       this.render();
       // Reconnect for anonymous browsing
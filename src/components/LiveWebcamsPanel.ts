@@ -15,7 +15,7 @@ interface WebcamFeed {
 
 // Verified YouTube live stream IDs — validated Feb 2026 via title cross-check.
 // IDs may rotate; update when stale.
-const WEBCAM_FEEDS: WebcamFeed[] = [
+const WEBCAM_FEEDS: readonly WebcamFeed[] = Object.freeze([
   // Middle East — Jerusalem & Tehran adjacent (conflict hotspots)
   { id: 'jerusalem', city: 'Jerusalem', country: 'Israel', region: 'middle-east', channelHandle: '@TheWesternWall', fallbackVideoId: 'UyduhBUpO7Q' },
   { id: 'tehran', city: 'Tehran', country: 'Iran', region: 'middle-east', channelHandle: '@IranHDCams', fallbackVideoId: '-zGuR1qVKrU' },
@@ -38,10 +38,34 @@ const WEBCAM_FEEDS: WebcamFeed[] = [
   { id: 'tokyo', city: 'Tokyo', country: 'Japan', region: 'asia', channelHandle: '@TokyoLiveCam4K', fallbackVideoId: '4pu9sF5Qssw' },
   { id: 'seoul', city: 'Seoul', country: 'South Korea', region: 'asia', channelHandle: '@UNvillage_live', fallbackVideoId: '-JhoMGoAfFc' },
   { id: 'sydney', city: 'Sydney', country: 'Australia', region: 'asia', channelHandle: '@WebcamSydney', fallbackVideoId: '7pcL-0Wo77U' },
-];
+]);
+
+// Region filters and the default grid are fixed, so resolve them once.
+// Everything here is frozen and shared by reference instead of copied.
+const FEEDS_BY_REGION = new Map<RegionFilter, readonly WebcamFeed[]>([['all', WEBCAM_FEEDS]]);
+for (const feed of WEBCAM_FEEDS) {
+  Object.freeze(feed);
+  const bucket = FEEDS_BY_REGION.get(feed.region);
+  FEEDS_BY_REGION.set(feed.region, bucket ? [...bucket, feed] : [feed]);
+}
+for (const bucket of FEEDS_BY_REGION.values()) Object.freeze(bucket);
+
+const ALL_GRID_IDS: readonly string[] = ['jerusalem', 'tehran', 'kyiv', 'washington'];
+const ALL_GRID_FEEDS: readonly WebcamFeed[] = Object.freeze(
+  WEBCAM_FEEDS.filter(f => ALL_GRID_IDS.includes(f.id))
+    .sort((a, b) => ALL_GRID_IDS.indexOf(a.id) - ALL_GRID_IDS.indexOf(b.id)),
+);
 
 const MAX_GRID_CELLS = 4;
 
+// Grid cells per region filter: the curated hotspots for 'all', otherwise the
+// region's first MAX_GRID_CELLS feeds, so rendering the grid is one lookup.
+const GRID_FEEDS_BY_REGION = new Map<RegionFilter, readonly WebcamFeed[]>();
+for (const [region, feeds] of FEEDS_BY_REGION) {
+  GRID_FEEDS_BY_REGION.set(region, Object.freeze(feeds.slice(0, MAX_GRID_CELLS)));
+}
+GRID_FEEDS_BY_REGION.set('all', ALL_GRID_FEEDS);
+
 type ViewMode = 'grid' | 'single';
 type RegionFilter = 'all' | WebcamRegion;
 
@@ -68,20 +92,12 @@ export class LiveWebcamsPanel extends Panel {
     this.render();
   }
 
-  private get filteredFeeds(): WebcamFeed[] {
-    if (this.regionFilter === 'all') return WEBCAM_FEEDS;
-    return WEBCAM_FEEDS.filter(f => f.region === this.regionFilter);
+  private get filteredFeeds(): readonly WebcamFeed[] {
+    return FEEDS_BY_REGION.get(this.regionFilter) ?? [];
   }
 
-  private static readonly ALL_GRID_IDS = ['jerusalem', 'tehran', 'kyiv', 'washington'];
-
-  private get gridFeeds(): WebcamFeed[] {
-    if (this.regionFilter === 'all') {
-      return LiveWebcamsPanel.ALL_GRID_IDS
-        .map(id => WEBCAM_FEEDS.find(f => f.id === id)!)
-        .filter(Boolean);
-    }
-    return this.filteredFeeds.slice(0, MAX_GRID_CELLS);
+  private get gridFeeds(): readonly WebcamFeed[] {
+    return GRID_FEEDS_BY_REGION.get(this.regionFilter) ?? [];
   }
 
   private createToolbar(): void {
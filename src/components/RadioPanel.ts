@@ -21,7 +21,7 @@ interface RadioStation {
 type RadioCategory = 'all' | 'news' | 'world' | 'business' | 'talk';
 
 // Global radio stations with direct stream URLs
-const RADIO_STATIONS: RadioStation[] = [
+const RADIO_STATIONS: readonly RadioStation[] = Object.freeze([
   // News
   { id: 'bbc-ws', name: 'BBC World Service', streamUrl: 'https://stream.live.vc.bbcmedia.co.uk/bbc_world_service', category: 'news', country: 'UK', language: 'en' },
   { id: 'npr', name: 'NPR News', streamUrl: 'https://npr-ice.streamguys1.com/live.mp3', category: 'news', country: 'US', language: 'en' },
@@ -41,7 +41,18 @@ const RADIO_STATIONS: RadioStation[] = [
   // Talk / Analysis
   { id: 'lbc', name: 'LBC News', streamUrl: 'https://media-ssl.musicradio.com/LBCNews', category: 'talk', country: 'UK', language: 'en' },
   { id: 'trt-world', name: 'TRT World Radio', streamUrl: 'https://trtradyo3.mediatriple.net/trtradyo3.mp3', category: 'talk', country: 'TR', language: 'en' },
-];
+]);
+
+// Lookups built once: category filter and station clicks no longer scan the list.
+// The registry and its buckets are frozen, so handing them out needs no copy.
+const STATION_BY_ID: ReadonlyMap<string, RadioStation> = new Map(RADIO_STATIONS.map(s => [s.id, s]));
+const STATIONS_BY_CATEGORY = new Map<RadioCategory, readonly RadioStation[]>([['all', RADIO_STATIONS]]);
+for (const station of RADIO_STATIONS) {
+  Object.freeze(station);
+  const bucket = STATIONS_BY_CATEGORY.get(station.category);
+  STATIONS_BY_CATEGORY.set(station.category, bucket ? [...bucket, station] : [station]);
+}
+for (const bucket of STATIONS_BY_CATEGORY.values()) Object.freeze(bucket);
 
 const CATEGORIES: { id: RadioCategory; label: string; icon: string }[] = [
   { id: 'all', label: 'All', icon: '📻' },
@@ -147,9 +158,8 @@ export class RadioPanel extends Panel {
     `;
   }
 
-  private getFilteredStations(): RadioStation[] {
-    if (this.activeCategory === 'all') return RADIO_STATIONS;
-    return RADIO_STATIONS.filter(s => s.category === this.activeCategory);
+  private getFilteredStations(): readonly RadioStation[] {
+    return STATIONS_BY_CATEGORY.get(this.activeCategory) ?? [];
   }
 
   private bindEvents(): void {
@@ -165,7 +175,7 @@ export class RadioPanel extends Panel {
     this.element.querySelectorAll('.radio-station').forEach(btn => {
       btn.addEventListener('click', () => {
         const stationId = (btn as HTMLElement).dataset.station!;
-        const station = RADIO_STATIONS.find(s => s.id === stationId);
+        const station = STATION_BY_ID.get(stationId);
         if (station) this.playStation(station);
       });
     });
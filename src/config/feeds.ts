@@ -381,7 +381,7 @@ export function isStateAffiliatedSource(sourceName: string): boolean {
   return !!profile?.stateAffiliated;
 }
 
-const FULL_FEEDS: Record<string, Feed[]> = {
+const FULL_FEEDS = (): Record<string, Feed[]> => ({
   politics: [
     { name: 'BBC World', url: rss('https://feeds.bbci.co.uk/news/world/rss.xml') },
     { name: 'NPR News', url: rss('https://feeds.npr.org/1001/rss.xml') },
@@ -569,10 +569,10 @@ const FULL_FEEDS: Record<string, Feed[]> = {
     { name: 'Reuters Energy', url: rss('https://news.google.com/rss/search?q=site:reuters.com+(oil+OR+gas+OR+energy+OR+OPEC)+when:3d&hl=en-US&gl=US&ceid=US:en') },
     { name: 'Mining & Resources', url: rss('https://news.google.com/rss/search?q=(lithium+OR+"rare+earth"+OR+cobalt+OR+mining)+when:3d&hl=en-US&gl=US&ceid=US:en') },
   ],
-};
+});
 
 // Tech/AI variant feeds
-const TECH_FEEDS: Record<string, Feed[]> = {
+const TECH_FEEDS = (): Record<string, Feed[]> => ({
   tech: [
     { name: 'TechCrunch', url: rss('https://techcrunch.com/feed/') },
     { name: 'The Verge', url: rss('https://www.theverge.com/rss/index.xml') },
@@ -793,10 +793,10 @@ const TECH_FEEDS: Record<string, Feed[]> = {
     { name: 'How I Built This', url: rss('https://news.google.com/rss/search?q="How+I+Built+This"+Guy+Raz+when:14d&hl=en-US&gl=US&ceid=US:en') },
     { name: 'Startup Podcasts', url: rss('https://news.google.com/rss/search?q=("Masters+of+Scale"+OR+"The+Pitch+podcast"+OR+"startup+podcast")+episode+when:14d&hl=en-US&gl=US&ceid=US:en') },
   ],
-};
+});
 
 // Finance/Trading variant feeds (all free RSS / Google News proxies)
-const FINANCE_FEEDS: Record<string, Feed[]> = {
+const FINANCE_FEEDS = (): Record<string, Feed[]> => ({
   markets: [
     { name: 'CNBC', url: rss('https://www.cnbc.com/id/100003114/device/rss/rss.html') },
     // Direct MarketWatch RSS returns frequent 403s from cloud IPs; use Google News fallback.
@@ -881,12 +881,12 @@ const FINANCE_FEEDS: Record<string, Feed[]> = {
     { name: 'Gulf Investments', url: rss('https://news.google.com/rss/search?q=("Saudi+Arabia"+OR+"UAE"+OR+"Abu+Dhabi")+investment+infrastructure+when:7d&hl=en-US&gl=US&ceid=US:en') },
     { name: 'Vision 2030', url: rss('https://news.google.com/rss/search?q="Vision+2030"+(project+OR+investment+OR+announced)+when:14d&hl=en-US&gl=US&ceid=US:en') },
   ],
-};
+});
 
 // ============================================
 // SPORTS VARIANT FEEDS
 // ============================================
-const SPORTS_FEEDS: Record<string, Feed[]> = {
+const SPORTS_FEEDS = (): Record<string, Feed[]> => ({
   football: [
     { name: 'BBC Sport Football', url: rss('https://feeds.bbci.co.uk/sport/football/rss.xml') },
     { name: 'ESPN FC', url: rss('https://www.espn.com/espn/rss/soccer/news') },
@@ -918,10 +918,11 @@ const SPORTS_FEEDS: Record<string, Feed[]> = {
     { name: 'Sports Breaking', url: rss('https://news.google.com/rss/search?q=sports+breaking+OR+upset+OR+record+when:1d&hl=en-US&gl=US&ceid=US:en') },
     { name: 'Olympics', url: rss('https://news.google.com/rss/search?q=Olympics+OR+Olympic+athlete+when:7d&hl=en-US&gl=US&ceid=US:en') },
   ],
-};
+});
 
-// Variant-aware exports
-export const FEEDS = SITE_VARIANT === 'tech' ? TECH_FEEDS : SITE_VARIANT === 'finance' ? FINANCE_FEEDS : SITE_VARIANT === 'sports' ? SPORTS_FEEDS : FULL_FEEDS;
+// Variant-aware exports. Each variant's table is a factory so only the active
+// one is built (and its proxy URLs encoded) when the module loads.
+export const FEEDS = (SITE_VARIANT === 'tech' ? TECH_FEEDS : SITE_VARIANT === 'finance' ? FINANCE_FEEDS : SITE_VARIANT === 'sports' ? SPORTS_FEEDS : FULL_FEEDS)();
 
 export const INTEL_SOURCES: Feed[] = [
   // Defense & Security (Tier 1)
@@ -967,6 +968,19 @@ export const INTEL_SOURCES: Feed[] = [
   { name: 'EU ISS', url: rss('https://news.google.com/rss/search?q=site:iss.europa.eu+when:7d&hl=en-US&gl=US&ceid=US:en'), type: 'intl' },
 ];
 
+// Flattened once at load so refreshes and the source toggle list do not walk
+// and re-sort the category map on every call.
+export const FEED_CATEGORIES: ReadonlyArray<{ key: string; feeds: Feed[] }> = Object.freeze(
+  Object.entries(FEEDS)
+    .filter((entry): entry is [string, Feed[]] => Array.isArray(entry[1]) && entry[1].length > 0)
+    .map(([key, feeds]) => ({ key, feeds }))
+);
+
+export const ALL_FEED_SOURCE_NAMES: readonly string[] = Object.freeze(
+  Array.from(new Set([...FEED_CATEGORIES.flatMap(c => c.feeds), ...INTEL_SOURCES].map(f => f.name)))
+    .sort((a, b) => a.localeCompare(b))
+);
+
 // Keywords that trigger alert status - must be specific to avoid false positives
 export const ALERT_KEYWORDS = [
   'war', 'invasion', 'military', 'nuclear', 'sanctions', 'missile',
@@ -52,6 +52,8 @@ export {
 // These are large data files that should be tree-shaken in tech builds
 export {
   FEEDS,
+  FEED_CATEGORIES,
+  ALL_FEED_SOURCE_NAMES,
   INTEL_SOURCES,
 } from './feeds';
 
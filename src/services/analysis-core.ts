@@ -34,6 +34,7 @@ import {
   findNewsForMarketSymbol,
 } from './entity-extraction';
 import { getEntityIndex } from './entity-index';
+import { groupBySimilarity } from '@/utils/news-clustering';
 import { aggregateThreats } from './threat-classifier';
 
 const TOPIC_BASELINE_WINDOW_MS = 7 * 24 * 60 * 60 * 1000;
@@ -161,11 +162,35 @@ export interface StreamSnapshot {
 // ============================================================================
 
 function generateClusterId(items: NewsItemWithTier[]): string {
-  const sorted = [...items].sort((a, b) => a.pubDate.getTime() - b.pubDate.getTime());
-  const first = sorted[0]!;
+  // Earliest item, first one wins on ties (same pick as a stable sort)
+  let first = items[0]!;
+  for (const item of items) {
+    if (item.pubDate.getTime() < first.pubDate.getTime()) first = item;
+  }
   return `${first.pubDate.getTime()}-${first.title.slice(0, 20).replace(/\W/g, '')}`;
 }
 
+// Lead items of a cluster: best (lowest) tier first, then newest
+function compareLeadItems(a: NewsItemWithTier, b: NewsItemWithTier): number {
+  const tierDiff = a.tier - b.tier;
+  if (tierDiff !== 0) return tierDiff;
+  return b.pubDate.getTime() - a.pubDate.getTime();
+}
+
+// First `k` items in compareLeadItems order, matching a stable sort + slice
+// but without copying and sorting the whole cluster.
+function topLeadItems(cluster: NewsItemWithTier[], k: number): NewsItemWithTier[] {
+  const top: NewsItemWithTier[] = [];
+  for (const item of cluster) {
+    let i = top.length;
+    while (i > 0 && compareLeadItems(item, top[i - 1]!) < 0) i--;
+    if (i >= k) continue;
+    top.splice(i, 0, item);
+    if (top.length > k) top.pop();
+  }
+  return top;
+}
+
 /**
  * Cluster news items by title similarity using Jaccard index.
  * Pure function - no side effects.
@@ -181,80 +206,28 @@ export function clusterNewsCore(
     tier: item.tier ?? getSourceTier(item.source),
   }));
 
-  const tokenCache = new Map<string, Set<string>>();
+  // Wire copies repeat the same headline across outlets; tokenize each distinct
+  // title once and share the set.
   const tokenList: Set<string>[] = [];
-  const invertedIndex = new Map<string, number[]>();
+  const tokensByTitle = new Map<string, Set<string>>();
   for (const item of itemsWithTier) {
-    const tokens = tokenize(item.title);
-    tokenCache.set(item.title, tokens);
-    tokenList.push(tokens);
-  }
-
-  for (let index = 0; index < tokenList.length; index++) {
-    const tokens = tokenList[index]!;
-    for (const token of tokens) {
-      const bucket = invertedIndex.get(token);
-      if (bucket) {
-        bucket.push(index);
-      } else {
-        invertedIndex.set(token, [index]);
-      }
+    let tokens = tokensByTitle.get(item.title);
+    if (!tokens) {
+      tokens = tokenize(item.title);
+      tokensByTitle.set(item.title, tokens);
     }
+    tokenList.push(tokens);
   }
 
-  const clusters: NewsItemWithTier[][] = [];
-  const assigned = new Set<number>();
-
-  for (let i = 0; i < itemsWithTier.length; i++) {
-    if (assigned.has(i)) continue;
-
-    const currentItem = itemsWithTier[i]!;
-    const cluster: NewsItemWithTier[] = [currentItem];
-    assigned.add(i);
-    const tokensI = tokenList[i]!;
-
-    const candidateIndices = new Set<number>();
-    for (const token of tokensI) {
-      const bucket = invertedIndex.get(token);
-      if (!bucket) continue;
-      for (const idx of bucket) {
-        if (idx > i) {
-          candidateIndices.add(idx);
-        }
-      }
-    }
-
-    const sortedCandidates = Array.from(candidateIndices).sort((a, b) => a - b);
-    for (const j of sortedCandidates) {
-      if (assigned.has(j)) {
-        continue;
-      }
-
-      const otherItem = itemsWithTier[j]!;
-      const tokensJ = tokenList[j]!;
-      const similarity = jaccardSimilarity(tokensI, tokensJ);
-
-      if (similarity >= SIMILARITY_THRESHOLD) {
-        cluster.push(otherItem);
-        assigned.add(j);
-      }
-    }
-
-    clusters.push(cluster);
-  }
+  const clusters = groupBySimilarity(tokenList, SIMILARITY_THRESHOLD)
+    .map(indices => indices.map(index => itemsWithTier[index]!));
 
   return clusters.map(cluster => {
-    const sorted = [...cluster].sort((a, b) => {
-      const tierDiff = a.tier - b.tier;
-      if (tierDiff !== 0) return tierDiff;
-      return b.pubDate.getTime() - a.pubDate.getTime();
-    });
-
-    const primary = sorted[0]!;
+    const leaders = topLeadItems(cluster, 3);
+    const primary = leaders[0]!;
     const dates = cluster.map(i => i.pubDate.getTime());
 
-    const topSources = sorted
-      .slice(0, 3)
+    const topSources = leaders
       .map(item => ({
         name: item.source,
         tier: item.tier,
@@ -95,6 +95,19 @@ export interface EntityMatch {
   position: number;
 }
 
+// Alias patterns are compiled once and reused across calls. They carry the
+// 'g' flag, so callers reset lastIndex before scanning.
+const aliasRegexCache = new Map<string, RegExp>();
+
+function getAliasRegex(alias: string): RegExp {
+  let regex = aliasRegexCache.get(alias);
+  if (!regex) {
+    regex = new RegExp(`\\b${escapeRegex(alias)}\\b`, 'gi');
+    aliasRegexCache.set(alias, regex);
+  }
+  return regex;
+}
+
 export function findEntitiesInText(text: string): EntityMatch[] {
   const index = getEntityIndex();
   const matches: EntityMatch[] = [];
@@ -102,9 +115,10 @@ export function findEntitiesInText(text: string): EntityMatch[] {
   const textLower = text.toLowerCase();
 
   for (const [alias, entityId] of index.byAlias) {
-    if (alias.length < 3) continue;
+    if (alias.length < 3 || seen.has(entityId)) continue;
 
-    const regex = new RegExp(`\\b${escapeRegex(alias)}\\b`, 'gi');
+    const regex = getAliasRegex(alias);
+    regex.lastIndex = 0;
     let match: RegExpExecArray | null;
     while ((match = regex.exec(text)) !== null) {
       if (!seen.has(entityId)) {
@@ -106,6 +106,19 @@ export interface GeoHubMatch {
   matchedKeyword: string;
 }
 
+// Runs for every feed item, so the boundary regexes are compiled once per
+// keyword rather than once per keyword per title.
+const shortKeywordRegexCache = new Map<string, RegExp>();
+
+function getShortKeywordRegex(keyword: string): RegExp {
+  let regex = shortKeywordRegexCache.get(keyword);
+  if (!regex) {
+    regex = new RegExp(`\\b${keyword}\\b`, 'i');
+    shortKeywordRegexCache.set(keyword, regex);
+  }
+  return regex;
+}
+
 export function inferGeoHubsFromTitle(title: string): GeoHubMatch[] {
   const index = buildGeoHubIndex();
   const matches: GeoHubMatch[] = [];
@@ -116,9 +129,7 @@ export function inferGeoHubsFromTitle(title: string): GeoHubMatch[] {
     if (keyword.length < 2) continue;
 
     // Word boundary check for short keywords to avoid false positives
-    const regex = keyword.length < 5
-      ? new RegExp(`\\b${keyword}\\b`, 'i')
-      : null;
+    const regex = keyword.length < 5 ? getShortKeywordRegex(keyword) : null;
 
     const found = regex
       ? regex.test(titleLower)
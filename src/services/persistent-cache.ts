@@ -9,8 +9,20 @@ type CacheEnvelope<T> = {
 
 const CACHE_PREFIX = 'globalpulse-persistent-cache:';
 
+// Desktop writes are coalesced: a feed refresh finishes dozens of feeds within
+// a few hundred ms, and every write_cache_entry call rewrites the whole cache
+// store file. Writes queued within the window go out as one batch command.
+const DESKTOP_WRITE_FLUSH_MS = 250;
+const pendingDesktopWrites = new Map<string, string>();
+// Entries whose batch write is still in flight; they stay readable until the
+// invoke settles so a read in that window doesn't see the old stored value.
+const flushingDesktopWrites = new Map<string, string>();
+let desktopFlush: Promise<void> | null = null;
+
 export async function getPersistentCache<T>(key: string): Promise<CacheEnvelope<T> | null> {
   if (isDesktopRuntime()) {
+    const pending = pendingDesktopWrites.get(key) ?? flushingDesktopWrites.get(key);
+    if (pending !== undefined) return JSON.parse(pending) as CacheEnvelope<T>;
     try {
       const value = await invokeTauri<CacheEnvelope<T> | null>('read_cache_entry', { key });
       return value ?? null;
@@ -27,23 +39,48 @@ export async function getPersistentCache<T>(key: string): Promise<CacheEnvelope<
   }
 }
 
+function writeLocalStorage(key: string, value: string): void {
+  try {
+    localStorage.setItem(`${CACHE_PREFIX}${key}`, value);
+  } catch {
+    // Ignore quota errors
+  }
+}
+
+function queueDesktopWrite(key: string, value: string): Promise<void> {
+  pendingDesktopWrites.set(key, value);
+  if (!desktopFlush) {
+    desktopFlush = new Promise<void>((resolve) => setTimeout(resolve, DESKTOP_WRITE_FLUSH_MS)).then(async () => {
+      const entries = Array.from(pendingDesktopWrites);
+      for (const [entryKey, value] of entries) flushingDesktopWrites.set(entryKey, value);
+      pendingDesktopWrites.clear();
+      desktopFlush = null;
+      try {
+        await invokeTauri<void>('write_cache_entries', { entries });
+      } catch (error) {
+        console.warn('[persistent-cache] Desktop write failed; falling back to localStorage', error);
+        for (const [entryKey, value] of entries) writeLocalStorage(entryKey, value);
+      } finally {
+        // A later batch may have taken over a key; leave its value in place
+        for (const [entryKey, value] of entries) {
+          if (flushingDesktopWrites.get(entryKey) === value) flushingDesktopWrites.delete(entryKey);
+        }
+      }
+    });
+  }
+  return desktopFlush;
+}
+
 export async function setPersistentCache<T>(key: string, data: T): Promise<void> {
   const payload: CacheEnvelope<T> = { key, data, updatedAt: Date.now() };
+  const value = JSON.stringify(payload);
 
   if (isDesktopRuntime()) {
-    try {
-      await invokeTauri<void>('write_cache_entry', { key, value: JSON.stringify(payload) });
-      return;
-    } catch (error) {
-      console.warn('[persistent-cache] Desktop write failed; falling back to localStorage', error);
-    }
+    await queueDesktopWrite(key, value);
+    return;
   }
 
-  try {
-    localStorage.setItem(`${CACHE_PREFIX}${key}`, JSON.stringify(payload));
-  } catch {
-    // Ignore quota errors
-  }
+  writeLocalStorage(key, value);
 }
 
 export function cacheAgeMs(updatedAt: number): number {
@@ -1,6 +1,7 @@
 import type { SocialUnrestEvent, ProtestSeverity, ProtestEventType } from '@/types';
 import { INTEL_HOTSPOTS } from '@/config';
-import { generateId, createCircuitBreaker } from '@/utils';
+import { createCircuitBreaker } from '@/utils';
+import { hash53 } from '@/utils/analysis-constants';
 
 // ACLED API - proxied through serverless function (token kept server-side)
 const ACLED_PROXY_URL = '/api/acled';
@@ -200,7 +201,8 @@ async function fetchGdeltEvents(): Promise<SocialUnrestEvent[]> {
       const country = name.split(',').pop()?.trim() || name;
 
       allEvents.push({
-        id: `gdelt-${generateId()}`,
+        // Keyed by location so the same event keeps its id across refreshes.
+        id: `gdelt-${hash53(lowerName).toString(36)}`,
         title: `${name} (${count} reports)`,
         eventType,
         country,
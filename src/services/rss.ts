@@ -1,11 +1,12 @@
 import type { Feed, NewsItem } from '@/types';
 import { SITE_VARIANT } from '@/config';
-import { chunkArray, fetchWithProxy } from '@/utils';
-import { classifyByKeyword, classifyWithAI } from './threat-classifier';
+import { fetchWithProxy } from '@/utils';
+import { classifyByKeyword, classifyWithAI, type ThreatClassification } from './threat-classifier';
 import { inferGeoHubsFromTitle } from './geo-hub-index';
 import { getPersistentCache, setPersistentCache } from './persistent-cache';
 import { ingestHeadlines } from './trending-keywords';
 import { getCurrentLanguage } from './i18n';
+import { hash53 } from '@/utils/analysis-constants';
 
 // Per-feed circuit breaker: track failures and cooldowns
 const FEED_COOLDOWN_MS = 5 * 60 * 1000; // 5 minutes after failure
@@ -23,13 +24,93 @@ const AI_CLASSIFY_MAX_PER_FEED =
   SITE_VARIANT === 'finance' ? 2 : SITE_VARIANT === 'tech' ? 2 : 3;
 const aiRecentlyQueued = new Map<string, number>();
 const aiDispatches: number[] = [];
+const SEEN_ENTRY_TTL_MS = 24 * 60 * 60 * 1000;
+const MAX_SEEN_ENTRIES = 5000;
+// Entries parsed on earlier refreshes, keyed by a hash of feed scope + link.
+// Most of a feed is unchanged between refreshes, so re-seen entries reuse the
+// item built last time (including any AI upgrade) instead of being classified
+// again. Map insertion order doubles as LRU order; the title check on lookup
+// guards against hash collisions.
+const seenEntries = new Map<number, { item: ClassifiedNewsItem; seenAt: number }>();
+
+type SerializedNewsItem = Omit<NewsItem, 'pubDate'> & { pubDate: string };
+type ClassifiedNewsItem = NewsItem & { threat: ThreatClassification };
+
+// Persistent cache entries are freshly deserialized, so revive dates in place
+// rather than copying every item. The write side needs no conversion at all:
+// JSON.stringify already emits Date as an ISO string.
+function fromSerializable(items: SerializedNewsItem[]): NewsItem[] {
+  for (const item of items) {
+    (item as unknown as NewsItem).pubDate = new Date(item.pubDate);
+  }
+  return items as unknown as NewsItem[];
+}
+
+const MAX_ITEMS_PER_FEED = 5;
+
+// Pull the few fields we use from an <item>/<entry> in one pass over its direct
+// children, instead of a descendant selector search per field.
+function readFeedEntry(item: Element, isAtom: boolean): { title: string; link: string; pubDateStr: string } {
+  let title = '';
+  let link = '';
+  let pubDate = '';
+  let published = '';
+  let updated = '';
+  for (let child = item.firstElementChild; child; child = child.nextElementSibling) {
+    switch (child.localName) {
+      case 'title':
+        if (!title) title = child.textContent || '';
+        break;
+      case 'link':
+        if (link) break;
+        link = isAtom ? (child.getAttribute('href') || '') : (child.textContent || '');
+        break;
+      case 'pubDate':
+        if (!pubDate) pubDate = child.textContent || '';
+        break;
+      case 'published':
+        if (!published) published = child.textContent || '';
+        break;
+      case 'updated':
+        if (!updated) updated = child.textContent || '';
+        break;
+    }
+  }
+  return { title, link, pubDateStr: isAtom ? (published || updated) : pubDate };
+}
+
+// DOMParser is not available in workers, so XML parsing and keyword
+// classification stay on the main thread but are split into separate tasks.
+function yieldToMain(): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, 0));
+}
 
-function toSerializable(items: NewsItem[]): Array<Omit<NewsItem, 'pubDate'> & { pubDate: string }> {
-  return items.map(item => ({ ...item, pubDate: item.pubDate.toISOString() }));
+// Only the first MAX_ITEMS_PER_FEED entries are read, so cut the document after
+// that many and keep its closing tail; feeds with hundreds of entries otherwise
+// build a full DOM on the main thread for items that are thrown away.
+function trimFeedXml(text: string): string {
+  const closeTag = text.includes('</item>') ? '</item>' : '</entry>';
+  let cut = 0;
+  for (let i = 0; i < MAX_ITEMS_PER_FEED; i++) {
+    const at = text.indexOf(closeTag, cut);
+    if (at === -1) return text;
+    cut = at + closeTag.length;
+  }
+  const tail = text.lastIndexOf(closeTag) + closeTag.length;
+  return tail > cut ? text.slice(0, cut) + text.slice(tail) : text;
+}
+
+function isTrimmedFeedIntact(doc: Document): boolean {
+  if (doc.querySelector('parsererror')) return false;
+  const entries = doc.querySelectorAll('item').length || doc.querySelectorAll('entry').length;
+  return entries === MAX_ITEMS_PER_FEED;
 }
 
-function fromSerializable(items: Array<Omit<NewsItem, 'pubDate'> & { pubDate: string }>): NewsItem[] {
-  return items.map(item => ({ ...item, pubDate: new Date(item.pubDate) }));
+// RSS (RFC 822) and Atom (ISO 8601) dates both go through the native parser in
+// one call; unparseable or missing dates fall back to fetch time.
+function parseFeedDate(value: string, fallbackMs: number): Date {
+  const ms = value ? Date.parse(value.trim()) : NaN;
+  return new Date(Number.isNaN(ms) ? fallbackMs : ms);
 }
 
 function getFeedScope(feedName: string, lang: string): string {
@@ -50,7 +131,7 @@ function getPersistentFeedKey(feedScope: string): string {
 }
 
 async function readPersistentFeed(key: string): Promise<NewsItem[] | null> {
-  const entry = await getPersistentCache<Array<Omit<NewsItem, 'pubDate'> & { pubDate: string }>>(key);
+  const entry = await getPersistentCache<SerializedNewsItem[]>(key);
   if (!entry?.data?.length) return null;
   return fromSerializable(entry.data);
 }
@@ -130,12 +211,28 @@ export function getFeedFailures(): Map<string, { count: number; cooldownUntil: n
   return currentLangFailures;
 }
 
+function getSeenEntry(key: number, title: string, now: number): ClassifiedNewsItem | null {
+  const entry = seenEntries.get(key);
+  if (!entry) return null;
+  seenEntries.delete(key);
+  if (now - entry.seenAt > SEEN_ENTRY_TTL_MS || entry.item.title !== title) return null;
+  seenEntries.set(key, entry);
+  return entry.item;
+}
+
+function rememberEntry(key: number, item: ClassifiedNewsItem, now: number): void {
+  seenEntries.set(key, { item, seenAt: now });
+  if (seenEntries.size > MAX_SEEN_ENTRIES) {
+    seenEntries.delete(seenEntries.keys().next().value!);
+  }
+}
+
 function toAiKey(title: string): string {
   return title.trim().toLowerCase().replace(/\s+/g, ' ');
 }
 
-function canQueueAiClassification(title: string): boolean {
-  const now = Date.now();
+// Expire rate-limit and dedup state once per feed rather than once per candidate.
+function pruneAiQueueState(now: number): void {
   while (aiDispatches.length > 0 && now - aiDispatches[0]! > AI_CLASSIFY_WINDOW_MS) {
     aiDispatches.shift();
   }
@@ -144,6 +241,9 @@ function canQueueAiClassification(title: string): boolean {
       aiRecentlyQueued.delete(key);
     }
   }
+}
+
+function canQueueAiClassification(title: string, now: number): boolean {
   if (aiDispatches.length >= AI_CLASSIFY_MAX_PER_WINDOW) {
     return false;
   }
@@ -159,7 +259,27 @@ function canQueueAiClassification(title: string): boolean {
   return true;
 }
 
-export async function fetchFeed(feed: Feed): Promise<NewsItem[]> {
+function resolveFeedUrl(feed: Feed, lang: string): string {
+  if (typeof feed.url === 'string') return feed.url;
+  return feed.url[lang] || feed.url['en'] || Object.values(feed.url)[0] || '';
+}
+
+// Several feeds are listed under more than one category (think tanks and intel
+// share a few). Concurrent requests for the same feed share one fetch + parse.
+const inFlightFeeds = new Map<string, Promise<NewsItem[]>>();
+
+export function fetchFeed(feed: Feed): Promise<NewsItem[]> {
+  const lang = getCurrentLanguage();
+  const key = `${getFeedScope(feed.name, lang)}\n${resolveFeedUrl(feed, lang)}`;
+  let pending = inFlightFeeds.get(key);
+  if (!pending) {
+    pending = loadFeed(feed).finally(() => inFlightFeeds.delete(key));
+    inFlightFeeds.set(key, pending);
+  }
+  return pending;
+}
+
+async function loadFeed(feed: Feed): Promise<NewsItem[]> {
   if (feedCache.size > MAX_CACHE_ENTRIES / 2) cleanupCaches();
   const currentLang = getCurrentLanguage();
   const feedScope = getFeedScope(feed.name, currentLang);
@@ -176,18 +296,25 @@ export async function fetchFeed(feed: Feed): Promise<NewsItem[]> {
   }
 
   try {
-    let url = typeof feed.url === 'string' ? feed.url : feed.url['en'];
-    if (typeof feed.url !== 'string') {
-      url = feed.url[currentLang] || feed.url['en'] || Object.values(feed.url)[0] || '';
-    }
-
+    const url = resolveFeedUrl(feed, currentLang);
     if (!url) throw new Error(`No URL found for feed ${feed.name}`);
 
     const response = await fetchWithProxy(url);
     if (!response.ok) throw new Error(`HTTP ${response.status}`);
     const text = await response.text();
+    // Several feeds often resolve in the same turn; give the main thread back
+    // before each parse so input and paint are not held behind a run of them.
+    await yieldToMain();
     const parser = new DOMParser();
-    const doc = parser.parseFromString(text, 'text/xml');
+    const trimmed = trimFeedXml(text);
+    let doc = parser.parseFromString(trimmed, 'text/xml');
+    // A close tag inside CDATA or a comment, or entries that are not siblings,
+    // can cut the text in the wrong place. Keep the trimmed parse only if it is
+    // clean and holds exactly the entries that were kept; otherwise the full
+    // text is authoritative.
+    if (trimmed !== text && !isTrimmedFeedIntact(doc)) {
+      doc = parser.parseFromString(text, 'text/xml');
+    }
 
     const parseError = doc.querySelector('parsererror');
     if (parseError) {
@@ -201,29 +328,22 @@ export async function fetchFeed(feed: Feed): Promise<NewsItem[]> {
     const isAtom = items.length === 0;
     if (isAtom) items = doc.querySelectorAll('entry');
 
+    const now = Date.now();
     const parsed = Array.from(items)
-      .slice(0, 5)
-      .map((item) => {
-        const title = item.querySelector('title')?.textContent || '';
-        let link = '';
-        if (isAtom) {
-          const linkEl = item.querySelector('link[href]');
-          link = linkEl?.getAttribute('href') || '';
-        } else {
-          link = item.querySelector('link')?.textContent || '';
-        }
-
-        const pubDateStr = isAtom
-          ? (item.querySelector('published')?.textContent || item.querySelector('updated')?.textContent || '')
-          : (item.querySelector('pubDate')?.textContent || '');
-        const parsedDate = pubDateStr ? new Date(pubDateStr) : new Date();
-        const pubDate = Number.isNaN(parsedDate.getTime()) ? new Date() : parsedDate;
+      .slice(0, MAX_ITEMS_PER_FEED)
+      .map((item): ClassifiedNewsItem => {
+        const { title, link, pubDateStr } = readFeedEntry(item, isAtom);
+        const entryKey = hash53(`${feedScope}\n${link || title}`);
+        const seen = getSeenEntry(entryKey, title, now);
+        if (seen) return seen;
+
+        const pubDate = parseFeedDate(pubDateStr, now);
         const threat = classifyByKeyword(title, SITE_VARIANT);
         const isAlert = threat.level === 'critical' || threat.level === 'high';
         const geoMatches = inferGeoHubsFromTitle(title);
         const topGeo = geoMatches[0];
 
-        return {
+        const newsItem: ClassifiedNewsItem = {
           source: feed.name,
           title,
           link,
@@ -233,10 +353,12 @@ export async function fetchFeed(feed: Feed): Promise<NewsItem[]> {
           ...(topGeo && { lat: topGeo.hub.lat, lon: topGeo.hub.lon, locationName: topGeo.hub.name }),
           lang: feed.lang,
         };
+        rememberEntry(entryKey, newsItem, now);
+        return newsItem;
       });
 
-    feedCache.set(feedScope, { items: parsed, timestamp: Date.now() });
-    void setPersistentCache(getPersistentFeedKey(feedScope), toSerializable(parsed));
+    feedCache.set(feedScope, { items: parsed, timestamp: now });
+    void setPersistentCache(getPersistentFeedKey(feedScope), parsed);
     recordFeedSuccess(feedScope);
     ingestHeadlines(parsed.map(item => ({
       title: item.title,
@@ -250,8 +372,9 @@ export async function fetchFeed(feed: Feed): Promise<NewsItem[]> {
       .sort((a, b) => b.pubDate.getTime() - a.pubDate.getTime())
       .slice(0, AI_CLASSIFY_MAX_PER_FEED);
 
+    if (aiCandidates.length > 0) pruneAiQueueState(now);
     for (const item of aiCandidates) {
-      if (!canQueueAiClassification(item.title)) continue;
+      if (!canQueueAiClassification(item.title, now)) continue;
       classifyWithAI(item.title, SITE_VARIANT).then((aiResult) => {
         if (aiResult && aiResult.confidence > item.threat.confidence) {
           item.threat = aiResult;
@@ -277,7 +400,7 @@ export async function fetchCategoryFeeds(
   } = {}
 ): Promise<NewsItem[]> {
   const topLimit = 20;
-  const batchSize = options.batchSize ?? 5;
+  const batchSize = Math.max(1, options.batchSize ?? 5);
   const currentLang = getCurrentLanguage();
 
   // Filter feeds by language:
@@ -285,7 +408,6 @@ export async function fetchCategoryFeeds(
   // 2. Feeds with explicit 'lang' must match current UI language
   const filteredFeeds = feeds.filter(feed => !feed.lang || feed.lang === currentLang);
 
-  const batches = chunkArray(filteredFeeds, batchSize);
   const topItems: NewsItem[] = [];
   let totalItems = 0;
 
@@ -309,11 +431,25 @@ export async function fetchCategoryFeeds(
     }
   };
 
-  for (const batch of batches) {
-    const results = await Promise.all(batch.map(fetchFeed));
-    results.flat().forEach(insertTopItem);
-    options.onBatch?.(ensureSortedDescending());
-  }
+  // A fixed pool of `batchSize` workers pulls feeds off a shared cursor, so one
+  // slow feed only holds its own slot instead of stalling a whole batch behind
+  // it. Progress is still reported every `batchSize` completed feeds.
+  let nextFeed = 0;
+  let completedSinceReport = 0;
+  const worker = async () => {
+    while (nextFeed < filteredFeeds.length) {
+      const feed = filteredFeeds[nextFeed++]!;
+      const items = await fetchFeed(feed);
+      items.forEach(insertTopItem);
+      completedSinceReport += 1;
+      if (completedSinceReport >= batchSize) {
+        completedSinceReport = 0;
+        options.onBatch?.(ensureSortedDescending());
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(batchSize, filteredFeeds.length) }, worker));
+  if (completedSinceReport > 0) options.onBatch?.(ensureSortedDescending());
 
   if (totalItems > 0) {
     import('./data-freshness').then(({ dataFreshness }) => {
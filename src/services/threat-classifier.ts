@@ -226,21 +226,62 @@ const SHORT_KEYWORDS = new Set([
 
 const keywordRegexCache = new Map<string, RegExp>();
 
+function escapeKeyword(kw: string): string {
+  return kw.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+function keywordPattern(kw: string): string {
+  return SHORT_KEYWORDS.has(kw) ? `\\b${escapeKeyword(kw)}\\b` : escapeKeyword(kw);
+}
+
 function getKeywordRegex(kw: string): RegExp {
   let re = keywordRegexCache.get(kw);
   if (!re) {
-    re = SHORT_KEYWORDS.has(kw)
-      ? new RegExp(`\\b${kw.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')}\\b`)
-      : new RegExp(kw.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+    re = new RegExp(keywordPattern(kw));
     keywordRegexCache.set(kw, re);
   }
   return re;
 }
 
+// One alternation per keyword tier, built once: a single scan of the title
+// rules out the whole tier, which is the common case for most headlines. Only
+// on a hit do we walk the tier in declaration order to pick the same keyword
+// (and category) the sequential scan always has.
+const tierRegexCache = new Map<KeywordMap, RegExp>();
+
+function getTierRegex(keywords: KeywordMap): RegExp {
+  let re = tierRegexCache.get(keywords);
+  if (!re) {
+    re = new RegExp(Object.keys(keywords).map(keywordPattern).join('|'));
+    tierRegexCache.set(keywords, re);
+  }
+  return re;
+}
+
+const EXCLUSIONS_REGEX = new RegExp(EXCLUSIONS.map(escapeKeyword).join('|'));
+
+// Every tier for a variant fused into one alternation. Most headlines match
+// nothing at all, and this settles them as 'info' in one scan of the title
+// instead of one per tier.
+const anyKeywordRegexCache = new Map<boolean, RegExp>();
+
+function getAnyKeywordRegex(isTech: boolean): RegExp {
+  let re = anyKeywordRegexCache.get(isTech);
+  if (!re) {
+    const tiers = isTech
+      ? [CRITICAL_KEYWORDS, HIGH_KEYWORDS, TECH_HIGH_KEYWORDS, MEDIUM_KEYWORDS, TECH_MEDIUM_KEYWORDS, LOW_KEYWORDS, TECH_LOW_KEYWORDS]
+      : [CRITICAL_KEYWORDS, HIGH_KEYWORDS, MEDIUM_KEYWORDS, LOW_KEYWORDS];
+    re = new RegExp(tiers.flatMap(tier => Object.keys(tier).map(keywordPattern)).join('|'));
+    anyKeywordRegexCache.set(isTech, re);
+  }
+  return re;
+}
+
 function matchKeywords(
   titleLower: string,
   keywords: KeywordMap
 ): { keyword: string; category: EventCategory } | null {
+  if (!getTierRegex(keywords).test(titleLower)) return null;
   for (const [kw, cat] of Object.entries(keywords)) {
     if (getKeywordRegex(kw).test(titleLower)) {
       return { keyword: kw, category: cat };
@@ -252,11 +293,14 @@ function matchKeywords(
 export function classifyByKeyword(title: string, variant = 'full'): ThreatClassification {
   const lower = title.toLowerCase();
 
-  if (EXCLUSIONS.some(ex => lower.includes(ex))) {
+  if (EXCLUSIONS_REGEX.test(lower)) {
     return { level: 'info', category: 'general', confidence: 0.3, source: 'keyword' };
   }
 
   const isTech = variant === 'tech';
+  if (!getAnyKeywordRegex(isTech).test(lower)) {
+    return { level: 'info', category: 'general', confidence: 0.3, source: 'keyword' };
+  }
 
   // Priority cascade: critical → high → medium → low → info
   let match = matchKeywords(lower, CRITICAL_KEYWORDS);
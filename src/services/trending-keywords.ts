@@ -1,7 +1,7 @@
 import type { CorrelationSignal } from './correlation';
 import { mlWorker } from './ml-worker';
 import { generateSummary } from './summarization';
-import { SUPPRESSED_TRENDING_TERMS, escapeRegex, generateSignalId, tokenize } from '@/utils/analysis-constants';
+import { SUPPRESSED_TRENDING_TERMS, escapeRegex, generateSignalId, hash53, tokenize } from '@/utils/analysis-constants';
 import { t } from '@/services/i18n';
 
 export interface TrendingHeadlineInput {
@@ -98,7 +98,7 @@ const LEADER_PATTERNS = LEADER_NAMES.map(name => ({
 }));
 
 const termFrequency = new Map<string, TermRecord>();
-const seenHeadlines = new Map<string, number>();
+const seenHeadlines = new Map<number, number>();
 const pendingSignals: CorrelationSignal[] = [];
 const activeSpikeTerms = new Set<string>();
 const autoSummaryRuns: number[] = [];
@@ -267,21 +267,24 @@ export async function extractEntitiesWithML(text: string): Promise<string[]> {
   }
 }
 
-function headlineKey(headline: TrendingHeadlineInput): string {
+// Seen-headline keys live for the whole 7-day baseline window, so the set
+// stores a 53-bit hash instead of the full source|link|title|date string.
+function headlineKey(headline: TrendingHeadlineInput): number {
   const publishedAt = Number.isFinite(headline.pubDate.getTime()) ? headline.pubDate.getTime() : 0;
-  return [
+  return hash53([
     headline.source.trim().toLowerCase(),
     (headline.link ?? '').trim().toLowerCase(),
     headline.title.trim().toLowerCase(),
     publishedAt,
-  ].join('|');
+  ].join('|'));
 }
 
 function pruneOldState(now: number): void {
+  // seenHeadlines is kept in seenAt order, so expiry stops at the first live
+  // entry instead of walking a week of headlines on every ingest.
   for (const [key, seenAt] of seenHeadlines) {
-    if (now - seenAt > BASELINE_WINDOW_MS) {
-      seenHeadlines.delete(key);
-    }
+    if (now - seenAt <= BASELINE_WINDOW_MS) break;
+    seenHeadlines.delete(key);
   }
 
   for (const [term, record] of termFrequency) {
@@ -621,6 +624,7 @@ export function ingestHeadlines(headlines: TrendingHeadlineInput[]): void {
     if (previouslySeen && now - previouslySeen <= BASELINE_WINDOW_MS) {
       continue;
     }
+    if (previouslySeen) seenHeadlines.delete(key);
     seenHeadlines.set(key, now);
 
     const termCandidates = buildBaseTermCandidates(headline.title);
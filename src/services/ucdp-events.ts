@@ -35,13 +35,19 @@ export async function fetchUcdpEvents(): Promise<UcdpEventsResponse> {
   }, { success: false, count: 0, data: [], cached_at: '' });
 }
 
-function haversineKm(lat1: number, lon1: number, lat2: number, lon2: number): number {
+const DEG_TO_RAD = Math.PI / 180;
+const DEDUP_WINDOW_DAYS = 7;
+const DEDUP_RADIUS_KM = 50;
+
+// Cosines of both latitudes are passed in so each side is computed once.
+function haversineKm(
+  lat1: number, lon1: number, cosLat1: number,
+  lat2: number, lon2: number, cosLat2: number,
+): number {
   const R = 6371;
-  const dLat = ((lat2 - lat1) * Math.PI) / 180;
-  const dLon = ((lon2 - lon1) * Math.PI) / 180;
-  const a = Math.sin(dLat / 2) ** 2 +
-    Math.cos((lat1 * Math.PI) / 180) * Math.cos((lat2 * Math.PI) / 180) *
-    Math.sin(dLon / 2) ** 2;
+  const dLat = (lat2 - lat1) * DEG_TO_RAD;
+  const dLon = (lon2 - lon1) * DEG_TO_RAD;
+  const a = Math.sin(dLat / 2) ** 2 + cosLat1 * cosLat2 * Math.sin(dLon / 2) ** 2;
   return R * 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
 }
 
@@ -52,30 +58,60 @@ interface AcledEvent {
   fatalities: string | number;
 }
 
+// ACLED rows held as parallel typed arrays: every UCDP event scans all of
+// them, so parse dates and numbers once up front instead of per comparison.
+interface AcledColumns {
+  lat: Float64Array;
+  lon: Float64Array;
+  cosLat: Float64Array;
+  dateMs: Float64Array;
+  deaths: Float64Array;
+}
+
+function toAcledColumns(acledEvents: AcledEvent[]): AcledColumns {
+  const n = acledEvents.length;
+  const columns: AcledColumns = {
+    lat: new Float64Array(n),
+    lon: new Float64Array(n),
+    cosLat: new Float64Array(n),
+    dateMs: new Float64Array(n),
+    deaths: new Float64Array(n),
+  };
+  for (let i = 0; i < n; i++) {
+    const acled = acledEvents[i]!;
+    const lat = Number(acled.latitude);
+    columns.lat[i] = lat;
+    columns.lon[i] = Number(acled.longitude);
+    columns.cosLat[i] = Math.cos(lat * DEG_TO_RAD);
+    columns.dateMs[i] = new Date(acled.event_date).getTime();
+    columns.deaths[i] = Number(acled.fatalities) || 0;
+  }
+  return columns;
+}
+
 export function deduplicateAgainstAcled(
   ucdpEvents: UcdpGeoEvent[],
   acledEvents: AcledEvent[],
 ): UcdpGeoEvent[] {
   if (!acledEvents.length) return ucdpEvents;
 
+  const acled = toAcledColumns(acledEvents);
+  const windowMs = DEDUP_WINDOW_DAYS * 24 * 60 * 60 * 1000;
+
   return ucdpEvents.filter(ucdp => {
     const uLat = ucdp.latitude;
     const uLon = ucdp.longitude;
+    const uCosLat = Math.cos(uLat * DEG_TO_RAD);
     const uDate = new Date(ucdp.date_start).getTime();
     const uDeaths = ucdp.deaths_best;
 
-    for (const acled of acledEvents) {
-      const aLat = Number(acled.latitude);
-      const aLon = Number(acled.longitude);
-      const aDate = new Date(acled.event_date).getTime();
-      const aDeaths = Number(acled.fatalities) || 0;
-
-      const dayDiff = Math.abs(uDate - aDate) / (1000 * 60 * 60 * 24);
-      if (dayDiff > 7) continue;
+    for (let i = 0; i < acled.lat.length; i++) {
+      if (Math.abs(uDate - acled.dateMs[i]!) > windowMs) continue;
 
-      const dist = haversineKm(uLat, uLon, aLat, aLon);
-      if (dist > 50) continue;
+      const dist = haversineKm(uLat, uLon, uCosLat, acled.lat[i]!, acled.lon[i]!, acled.cosLat[i]!);
+      if (dist > DEDUP_RADIUS_KM) continue;
 
+      const aDeaths = acled.deaths[i]!;
       if (uDeaths === 0 && aDeaths === 0) return false;
       if (uDeaths > 0 && aDeaths > 0) {
         const ratio = uDeaths / aDeaths;
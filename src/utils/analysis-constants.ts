@@ -179,9 +179,12 @@ export function tokenize(text: string): Set<string> {
 
 export function jaccardSimilarity(a: Set<string>, b: Set<string>): number {
   if (a.size === 0 && b.size === 0) return 0;
-  const intersection = new Set([...a].filter(x => b.has(x)));
-  const union = new Set([...a, ...b]);
-  return intersection.size / union.size;
+  const [small, large] = a.size <= b.size ? [a, b] : [b, a];
+  let intersection = 0;
+  for (const x of small) {
+    if (large.has(x)) intersection++;
+  }
+  return intersection / (a.size + b.size - intersection);
 }
 
 export function includesKeyword(text: string, keywords: string[]): boolean {
@@ -212,6 +215,20 @@ export function findRelatedTopics(prediction: string): string[] {
   return [...new Set(related)];
 }
 
+// 53-bit non-cryptographic string hash (cyrb53), for compact Map/Set keys.
+export function hash53(text: string): number {
+  let h1 = 0xdeadbeef;
+  let h2 = 0x41c6ce57;
+  for (let i = 0; i < text.length; i++) {
+    const ch = text.charCodeAt(i);
+    h1 = Math.imul(h1 ^ ch, 2654435761);
+    h2 = Math.imul(h2 ^ ch, 1597334677);
+  }
+  h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+  h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+  return 4294967296 * (2097151 & h2) + (h1 >>> 0);
+}
+
 export function generateSignalId(): string {
   return `sig-${Date.now()}-${Math.random().toString(36).slice(2, 8)}`;
 }
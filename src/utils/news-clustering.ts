@@ -0,0 +1,70 @@
+/**
+ * Title-similarity grouping behind clusterNewsCore.
+ * Dependency-free so the grouping can be checked against a plain pairwise
+ * Jaccard pass outside the bundler (tests/news-clustering.test.mjs).
+ */
+
+/**
+ * Greedily group token sets whose Jaccard index with the group's first member
+ * is at least `threshold`. Returns groups of indices into `tokenList`, each in
+ * ascending order, groups ordered by their first member.
+ */
+export function groupBySimilarity(tokenList: Set<string>[], threshold: number): number[][] {
+  const invertedIndex = new Map<string, number[]>();
+  for (let index = 0; index < tokenList.length; index++) {
+    for (const token of tokenList[index]!) {
+      const bucket = invertedIndex.get(token);
+      if (bucket) {
+        bucket.push(index);
+      } else {
+        invertedIndex.set(token, [index]);
+      }
+    }
+  }
+
+  const groups: number[][] = [];
+  const assigned = new Set<number>();
+
+  for (let i = 0; i < tokenList.length; i++) {
+    if (assigned.has(i)) continue;
+
+    const group = [i];
+    assigned.add(i);
+    const tokensI = tokenList[i]!;
+
+    // Walking the posting lists counts each candidate's shared tokens as a side
+    // effect, so the Jaccard index falls out as overlap / (|A| + |B| - overlap)
+    // with no per-pair set intersection. Jaccard can never exceed
+    // min(|A|,|B|) / max(|A|,|B|), so candidates whose size ratio is already
+    // below the threshold are skipped without counting.
+    const minSize = tokensI.size * threshold;
+    const maxSize = tokensI.size / threshold;
+    const overlaps = new Map<number, number>();
+    for (const token of tokensI) {
+      const bucket = invertedIndex.get(token);
+      if (!bucket) continue;
+      for (const idx of bucket) {
+        const size = tokenList[idx]!.size;
+        if (size < minSize || size > maxSize) continue;
+        if (idx > i && !assigned.has(idx)) {
+          overlaps.set(idx, (overlaps.get(idx) ?? 0) + 1);
+        }
+      }
+    }
+
+    const sortedCandidates = Array.from(overlaps.keys()).sort((a, b) => a - b);
+    for (const j of sortedCandidates) {
+      const overlap = overlaps.get(j)!;
+      const similarity = overlap / (tokensI.size + tokenList[j]!.size - overlap);
+
+      if (similarity >= threshold) {
+        group.push(j);
+        assigned.add(j);
+      }
+    }
+
+    groups.push(group);
+  }
+
+  return groups;
+}
@@ -0,0 +1,110 @@
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import { readFileSync } from 'node:fs';
+import { dirname, resolve } from 'node:path';
+import { fileURLToPath } from 'node:url';
+import * as ts from 'typescript';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+
+function loadGroupBySimilarity() {
+  const sourcePath = resolve(__dirname, '../src/utils/news-clustering.ts');
+  const source = readFileSync(sourcePath, 'utf-8');
+  const transpiled = ts.transpileModule(source, {
+    compilerOptions: {
+      module: ts.ModuleKind.CommonJS,
+      target: ts.ScriptTarget.ES2020,
+    },
+    fileName: sourcePath,
+  });
+
+  const module = { exports: {} };
+  const evaluator = new Function('exports', 'module', transpiled.outputText);
+  evaluator(module.exports, module);
+  return module.exports.groupBySimilarity;
+}
+
+const groupBySimilarity = loadGroupBySimilarity();
+
+function jaccard(a, b) {
+  if (a.size === 0 && b.size === 0) return 0;
+  let intersection = 0;
+  for (const token of a) {
+    if (b.has(token)) intersection++;
+  }
+  return intersection / (a.size + b.size - intersection);
+}
+
+// Reference grouping: the same greedy pass, scoring every later unassigned
+// title with a plain pairwise Jaccard index and no candidate pruning.
+function groupByPairwiseJaccard(tokenList, threshold) {
+  const groups = [];
+  const assigned = new Set();
+  for (let i = 0; i < tokenList.length; i++) {
+    if (assigned.has(i)) continue;
+    const group = [i];
+    assigned.add(i);
+    for (let j = i + 1; j < tokenList.length; j++) {
+      if (assigned.has(j)) continue;
+      if (jaccard(tokenList[i], tokenList[j]) >= threshold) {
+        group.push(j);
+        assigned.add(j);
+      }
+    }
+    groups.push(group);
+  }
+  return groups;
+}
+
+function mulberry32(seed) {
+  return () => {
+    seed = (seed + 0x6d2b79f5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+// Headline-like token sets over a small vocabulary so many pairs overlap,
+// with repeated wire copies and a few empty titles mixed in.
+function randomTokenLists(seed, count) {
+  const random = mulberry32(seed);
+  const vocabulary = Array.from({ length: 40 }, (_, i) => `word${i}`);
+  const lists = [];
+  for (let i = 0; i < count; i++) {
+    if (lists.length > 0 && random() < 0.15) {
+      lists.push(lists[Math.floor(random() * lists.length)]);
+      continue;
+    }
+    const size = Math.floor(random() * 12);
+    const tokens = new Set();
+    while (tokens.size < size) tokens.add(vocabulary[Math.floor(random() * vocabulary.length)]);
+    lists.push(tokens);
+  }
+  return lists;
+}
+
+describe('news clustering', () => {
+  it('matches pairwise Jaccard grouping across thresholds', () => {
+    for (const threshold of [0.3, 0.4, 0.5, 0.6, 0.7]) {
+      for (let seed = 1; seed <= 300; seed++) {
+        const tokenList = randomTokenLists(seed, 120);
+        assert.deepEqual(
+          groupBySimilarity(tokenList, threshold),
+          groupByPairwiseJaccard(tokenList, threshold),
+          `grouping diverged at threshold ${threshold}, seed ${seed}`,
+        );
+      }
+    }
+  });
+
+  it('keeps pairs exactly at the threshold and the size-ratio bound', () => {
+    const tokenList = [
+      new Set(['a', 'b', 'c', 'd']),
+      new Set(['a', 'b']), // J = 2/4, size ratio exactly 0.5
+      new Set(['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']), // ratio below 0.5, pruned
+      new Set(['c', 'd', 'x']), // J = 2/5 with the first title
+    ];
+    assert.deepEqual(groupBySimilarity(tokenList, 0.5), [[0, 1], [2], [3]]);
+  });
+});